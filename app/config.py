@@ -46,6 +46,7 @@ class Settings(BaseSettings):
     high_quality_threshold: float = 0.80
     min_match_threshold: float = 0.60
     max_matches_per_job: int = 10
+    matching_concurrency: int = 8  # Jobs matched at once; keep below the DB pool size
     
     # Report Settings
     daily_report_time: str = "07:30"  # Time to send daily reports
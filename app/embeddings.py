@@ -1,5 +1,7 @@
 import os
-from typing import List, Optional
+import hashlib
+from collections import OrderedDict
+from typing import List, Optional, Any
 import numpy as np
 from openai import AsyncOpenAI
 import logging
@@ -7,8 +9,55 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# (field, label) pairs in the order they appear in the embedded text
+_JOB_TEXT_FIELDS = (
+    ('title', 'Title'),
+    ('role', 'Role'),
+    ('seniority', 'Seniority'),
+    ('description', 'Description'),
+    ('skills', 'Skills'),
+    ('languages', 'Languages'),
+    ('location_city', 'City'),
+    ('location_country', 'Country'),
+    ('onsite_mode', 'Work mode'),
+    ('duration', 'Duration'),
+)
+
+_CONSULTANT_TEXT_FIELDS = (
+    ('name', 'Name'),
+    ('role', 'Role'),
+    ('seniority', 'Seniority'),
+    ('skills', 'Skills'),
+    ('languages', 'Languages'),
+    ('location_city', 'City'),
+    ('location_country', 'Country'),
+    ('onsite_mode', 'Work mode'),
+    ('notes', 'Notes'),
+)
+
+# Pass to model_dump(include=...) so only the fields used for the text are dumped
+JOB_TEXT_FIELDS = frozenset(field for field, _ in _JOB_TEXT_FIELDS)
+CONSULTANT_TEXT_FIELDS = frozenset(field for field, _ in _CONSULTANT_TEXT_FIELDS)
+
+# Truncate long consultant notes
+MAX_NOTES_LENGTH = 2000
+
+
+def _format_field(value: Any) -> Any:
+    """Comma-join list values; anything else is formatted as is."""
+    if isinstance(value, list):
+        return ', '.join(value)
+    return value
+
+
 class EmbeddingService:
-    def __init__(self):
+    def __init__(self, cache: Optional[Any] = None):
+        # Repository holding the content-hash embedding cache (get/store_cached_embeddings)
+        self.cache = cache
+        # Recently used hash -> float32 embedding, checked before the database cache.
+        # Vectors are stored as halfvec, so float32 keeps every bit that is persisted
+        self._memory_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._memory_cache_size = int(os.getenv("EMBEDDING_MEMORY_CACHE_SIZE", "10000"))
         self.backend = os.getenv("EMBEDDING_BACKEND", "local")
         if self.backend == "openai":
             api_key = os.getenv("OPENAI_API_KEY")
@@ -40,7 +89,6 @@ class EmbeddingService:
                 raise
         else:
             # Simple local embedding - deterministic vector from text
-            import hashlib
             text_hash = hashlib.sha256(text.encode()).digest()
             # Create a 1536-dimensional vector
             embedding = []
@@ -69,81 +117,90 @@ class EmbeddingService:
                 embeddings.append(await self.create_embedding(text))
             return embeddings
     
+    async def create_embeddings_batch(self, texts: List[str], batch_size: int = 128) -> List[List[float]]:
+        """Create embeddings for many texts with one provider request per batch_size texts."""
+        embeddings: List[List[float]] = [[] for _ in texts]
+        
+        # The API rejects empty input; those keep an empty embedding, as in create_embedding
+        indexed = [(i, text) for i, text in enumerate(texts) if text]
+        for start in range(0, len(indexed), batch_size):
+            chunk = indexed[start:start + batch_size]
+            vectors = await self.create_embeddings([text for _, text in chunk])
+            for (i, _), vector in zip(chunk, vectors):
+                embeddings[i] = vector
+        
+        return embeddings
+    
+    async def get_or_create_embedding(self, text: str) -> List[float]:
+        """Create embedding for a single text, reusing a cached vector for identical text."""
+        embeddings = await self.get_or_create_embeddings([text])
+        return embeddings[0]
+    
+    async def get_or_create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Create embeddings for many texts, only calling the provider for text not seen before."""
+        # Local embeddings are cheaper to compute than to look up
+        if not self.cache or self.backend != "openai":
+            return await self.create_embeddings_batch(texts)
+        
+        hashes = [hashlib.sha256(text.encode()).digest() for text in texts]
+        cached = {}
+        for text_hash in hashes:
+            if text_hash in self._memory_cache:
+                self._memory_cache.move_to_end(text_hash)
+                cached[text_hash] = self._memory_cache[text_hash].tolist()
+        
+        lookup = list({text_hash for text_hash in hashes if text_hash not in cached})
+        if lookup:
+            try:
+                cached.update(await self.cache.get_cached_embeddings(lookup, self.model_version))
+            except Exception as e:
+                logger.warning(f"Embedding cache lookup failed, embedding without it: {e}")
+                return await self.create_embeddings_batch(texts)
+        
+        # Identical texts within the batch are embedded once
+        missing = {}
+        for text_hash, text in zip(hashes, texts):
+            if text and text_hash not in cached:
+                missing.setdefault(text_hash, text)
+        
+        if missing:
+            vectors = await self.create_embeddings_batch(list(missing.values()))
+            created = {text_hash: vector for text_hash, vector in zip(missing, vectors) if vector}
+            try:
+                await self.cache.store_cached_embeddings(list(created.items()), self.model_version)
+            except Exception as e:
+                logger.warning(f"Failed to store embeddings in cache: {e}")
+            cached.update(created)
+        
+        self._remember(cached)
+        return [cached.get(text_hash, []) for text_hash in hashes]
+    
+    def _remember(self, embeddings: dict):
+        """Add embeddings to the in-process LRU, evicting the least recently used."""
+        for text_hash, embedding in embeddings.items():
+            if text_hash not in self._memory_cache:
+                self._memory_cache[text_hash] = np.asarray(embedding, dtype=np.float32)
+            self._memory_cache.move_to_end(text_hash)
+        while len(self._memory_cache) > self._memory_cache_size:
+            self._memory_cache.popitem(last=False)
+    
     def prepare_job_text(self, job_data: dict) -> str:
         """Prepare job data for embedding."""
-        parts = []
-        
-        if job_data.get('title'):
-            parts.append(f"Title: {job_data['title']}")
-        
-        if job_data.get('role'):
-            parts.append(f"Role: {job_data['role']}")
-        
-        if job_data.get('seniority'):
-            parts.append(f"Seniority: {job_data['seniority']}")
-        
-        if job_data.get('description'):
-            parts.append(f"Description: {job_data['description']}")
-        
-        if job_data.get('skills'):
-            skills = job_data['skills'] if isinstance(job_data['skills'], list) else [job_data['skills']]
-            parts.append(f"Skills: {', '.join(skills)}")
-        
-        if job_data.get('languages'):
-            langs = job_data['languages'] if isinstance(job_data['languages'], list) else [job_data['languages']]
-            parts.append(f"Languages: {', '.join(langs)}")
-        
-        if job_data.get('location_city'):
-            parts.append(f"City: {job_data['location_city']}")
-        
-        if job_data.get('location_country'):
-            parts.append(f"Country: {job_data['location_country']}")
-        
-        if job_data.get('onsite_mode'):
-            parts.append(f"Work mode: {job_data['onsite_mode']}")
-        
-        if job_data.get('duration'):
-            parts.append(f"Duration: {job_data['duration']}")
-        
-        return "\n".join(parts)
+        return "\n".join(
+            f"{label}: {_format_field(job_data[field])}"
+            for field, label in _JOB_TEXT_FIELDS
+            if job_data.get(field)
+        )
     
     def prepare_consultant_text(self, consultant_data: dict) -> str:
         """Prepare consultant data for embedding."""
-        parts = []
-        
-        if consultant_data.get('name'):
-            parts.append(f"Name: {consultant_data['name']}")
-        
-        if consultant_data.get('role'):
-            parts.append(f"Role: {consultant_data['role']}")
-        
-        if consultant_data.get('seniority'):
-            parts.append(f"Seniority: {consultant_data['seniority']}")
-        
-        if consultant_data.get('skills'):
-            skills = consultant_data['skills'] if isinstance(consultant_data['skills'], list) else [consultant_data['skills']]
-            parts.append(f"Skills: {', '.join(skills)}")
-        
-        if consultant_data.get('languages'):
-            langs = consultant_data['languages'] if isinstance(consultant_data['languages'], list) else [consultant_data['languages']]
-            parts.append(f"Languages: {', '.join(langs)}")
-        
-        if consultant_data.get('location_city'):
-            parts.append(f"City: {consultant_data['location_city']}")
-        
-        if consultant_data.get('location_country'):
-            parts.append(f"Country: {consultant_data['location_country']}")
-        
-        if consultant_data.get('onsite_mode'):
-            parts.append(f"Work mode: {consultant_data['onsite_mode']}")
-        
         if consultant_data.get('notes'):
-            # Truncate notes if too long
-            notes_text = consultant_data['notes'][:2000] if consultant_data.get('notes') and len(consultant_data['notes']) > 2000 else consultant_data.get('notes', '')
-            if notes_text:
-                parts.append(f"Notes: {notes_text}")
-        
-        return "\n".join(parts)
+            consultant_data = {**consultant_data, 'notes': consultant_data['notes'][:MAX_NOTES_LENGTH]}
+        return "\n".join(
+            f"{label}: {_format_field(consultant_data[field])}"
+            for field, label in _CONSULTANT_TEXT_FIELDS
+            if consultant_data.get(field)
+        )
     
     def cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors."""
@@ -6,13 +6,15 @@ Uses FastAPI with HTMX for dynamic interactions without heavy JavaScript
 import re
 
 from fastapi import APIRouter, Request, Form, Query, BackgroundTasks, Depends
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 from typing import Optional, List
 import os
 from datetime import datetime, timezone
 from uuid import UUID
 from app.auth import require_auth_cookie
+from app.parse.keywords import keyword_matcher_for
+from app.embeddings import CONSULTANT_TEXT_FIELDS
 
 from app.repo import (
     DEFAULT_EXECUTIVE_LANGUAGES,
@@ -30,6 +32,35 @@ router = APIRouter(prefix="/consultant", tags=["frontend"])
 # Setup Jinja2 templates
 templates = Jinja2Templates(directory="app/templates")
 
+# Static HTMX fragments, encoded once at import instead of on every request
+_HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+
+_MANUAL_CONFIG_SAVED_BODY = b"""
+        <div class="text-green-400 text-sm mt-2">Manual criteria saved. Future scans will use the updated settings.</div>
+        """
+
+_SCAN_TRIGGERED_BODY = b"""
+    <div class="alert alert-info" id="scan-status">
+        <div class="spinner-border spinner-border-sm me-2"></div>
+        Scan triggered! Running in background...
+    </div>
+    <script>
+        setTimeout(() => {
+            document.getElementById('scan-status').innerHTML = 
+                '<div class="alert alert-success">Scan initiated successfully!</div>';
+        }, 2000);
+    </script>
+    """
+
+_MATCHES_GENERATING_BODY = b"""
+    <div class="alert alert-info">
+        Generating matches in background...
+        <script>
+            setTimeout(() => location.reload(), 3000);
+        </script>
+    </div>
+    """
+
 
 def _split_to_list(value: str, *, to_upper: bool = False, to_lower: bool = False) -> List[str]:
     """Split textarea or comma-separated input into a list of unique strings."""
@@ -58,6 +89,28 @@ def _split_to_list(value: str, *, to_upper: bool = False, to_lower: bool = False
     return unique_items
 
 
+def _split_csv(value: str, *, to_upper: bool = False, to_lower: bool = False) -> List[str]:
+    """Split comma-only input into a list of unique strings without going through the regex engine."""
+    if not value:
+        return []
+
+    seen = set()
+    unique_items = []
+    for part in value.split(','):
+        cleaned = part.strip()
+        if not cleaned:
+            continue
+        if to_upper:
+            cleaned = cleaned.upper()
+        elif to_lower:
+            cleaned = cleaned.lower()
+        if cleaned in seen:
+            continue
+        seen.add(cleaned)
+        unique_items.append(cleaned)
+    return unique_items
+
+
 def _list_to_text(values: Optional[List[str]], separator: str = "\n") -> str:
     if not values:
         return ""
@@ -184,8 +237,10 @@ async def consultant_add(
     
     # Generate embeddings in background
     async def generate_embedding():
-        text = embedding_service.prepare_consultant_text(consultant_data.dict())
-        embedding = await embedding_service.create_embedding(text)
+        text = embedding_service.prepare_consultant_text(
+            consultant_data.model_dump(include=CONSULTANT_TEXT_FIELDS)
+        )
+        embedding = await embedding_service.get_or_create_embedding(text)
         if embedding:
             await db_repo.store_consultant_embedding(consultant.consultant_id, embedding)
     
@@ -255,7 +310,7 @@ async def scanner_control(request: Request):
 
     # Get scheduler status
     status = "running" if scanner_scheduler.scheduler.running else "stopped"
-    jobs = scanner_scheduler.scheduler.get_jobs()
+    jobs = scanner_scheduler.get_jobs()
 
     # Get recent scan logs
     from app.main import db_repo
@@ -343,11 +398,11 @@ async def update_manual_scanner_config(
     keywords_list = _split_to_list(target_keywords)
     skills_list = _split_to_list(target_skills)
     locations_list = _split_to_list(target_locations)
-    languages_list = _split_to_list(languages, to_upper=True)
-    onsite_list = _split_to_list(onsite_modes, to_lower=True)
+    languages_list = _split_csv(languages, to_upper=True)
+    onsite_list = _split_csv(onsite_modes, to_lower=True)
     seniority_list = _split_to_list(seniority_levels)
-    countries_list = _split_to_list(countries, to_upper=True)
-    levels_list = _split_to_list(levels, to_upper=True)
+    countries_list = _split_csv(countries, to_upper=True)
+    levels_list = _split_csv(levels, to_upper=True)
 
     if not roles_list:
         roles_list = DEFAULT_EXECUTIVE_ROLES
@@ -368,6 +423,9 @@ async def update_manual_scanner_config(
     if not levels_list:
         levels_list = DEFAULT_VERAMA_LEVELS
 
+    # Warm the matcher cache so scanners reuse the compiled pattern for the new criteria
+    keyword_matcher_for(roles_list, keywords_list)
+
     overrides = {
         'countries': countries_list,
         'languages': languages_list,
@@ -389,11 +447,7 @@ async def update_manual_scanner_config(
         source_overrides=overrides
     )
 
-    return HTMLResponse(
-        """
-        <div class=\"text-green-400 text-sm mt-2\">Manual criteria saved. Future scans will use the updated settings.</div>
-        """
-    )
+    return Response(content=_MANUAL_CONFIG_SAVED_BODY, media_type=_HTML_MEDIA_TYPE)
 
 @router.post("/scanner/trigger", response_class=HTMLResponse)
 async def trigger_scan(
@@ -411,18 +465,7 @@ async def trigger_scan(
     
     background_tasks.add_task(scanner_scheduler.trigger_scan_now, config_id)
     
-    return """
-    <div class="alert alert-info" id="scan-status">
-        <div class="spinner-border spinner-border-sm me-2"></div>
-        Scan triggered! Running in background...
-    </div>
-    <script>
-        setTimeout(() => {
-            document.getElementById('scan-status').innerHTML = 
-                '<div class="alert alert-success">Scan initiated successfully!</div>';
-        }, 2000);
-    </script>
-    """
+    return Response(content=_SCAN_TRIGGERED_BODY, media_type=_HTML_MEDIA_TYPE)
 
 @router.get("/matches", response_class=HTMLResponse)
 async def matches_view(
@@ -483,14 +526,7 @@ async def generate_matches(
     
     background_tasks.add_task(run_matching)
     
-    return """
-    <div class="alert alert-info">
-        Generating matches in background...
-        <script>
-            setTimeout(() => location.reload(), 3000);
-        </script>
-    </div>
-    """
+    return Response(content=_MATCHES_GENERATING_BODY, media_type=_HTML_MEDIA_TYPE)
 
 @router.get("/reports", response_class=HTMLResponse)
 async def reports_view(request: Request):
@@ -12,9 +12,11 @@ logger = logging.getLogger(__name__)
 class BaseIngester(ABC):
     """Base class for all job ingestion sources."""
     
-    def __init__(self, source_name: str):
+    def __init__(self, source_name: str, client: Optional[httpx.AsyncClient] = None):
         self.source_name = source_name
-        self.client = httpx.AsyncClient(
+        # A shared client is owned (and closed) by whoever passed it in
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(
             timeout=30.0,
             headers={
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -25,7 +27,8 @@ class BaseIngester(ABC):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
     
     @abstractmethod
     async def fetch_jobs(self) -> List[JobIn]:
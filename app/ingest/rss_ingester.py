@@ -1,164 +1,458 @@
+import asyncio
+import os
 import feedparser
-from typing import List, Optional, Dict, Any
-from datetime import datetime, timezone
+import httpx
+from concurrent.futures import Executor
+from io import BytesIO
+from typing import List, Optional, Dict, Any, Iterator
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from xml.etree import ElementTree
 import logging
 import re
+import string
+import sys
 
+# google-re2 gives linear-time matching for the patterns applied to untrusted feed text
+try:
+    import re2 as linear_re
+except ImportError:
+    linear_re = re
+
+from app.config import SKILL_ALIASES
 from app.models import JobIn
 from app.ingest.base import BaseIngester
 
 logger = logging.getLogger(__name__)
 
+# Common technical skills and technologies
+SKILL_KEYWORDS = (
+    # Programming languages
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C#', 'C++',
+    'Go', 'Rust', 'Kotlin', 'Swift', 'Ruby', 'PHP', 'Scala',
+
+    # Frameworks
+    'React', 'Angular', 'Vue', 'Django', 'Flask', 'FastAPI',
+    'Spring', 'Node.js', '.NET', 'Rails', 'Laravel',
+
+    # Databases
+    'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch',
+    'SQL', 'NoSQL', 'Oracle', 'SQL Server',
+
+    # Cloud & DevOps
+    'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins',
+    'CI/CD', 'Terraform', 'Ansible', 'Linux',
+
+    # Data & AI
+    'Machine Learning', 'AI', 'Data Science', 'TensorFlow',
+    'PyTorch', 'Pandas', 'NumPy', 'Spark', 'Hadoop',
+
+    # Other
+    'REST', 'GraphQL', 'Microservices', 'Agile', 'Scrum',
+    'Git', 'DevOps', 'Cloud', 'Security', 'Testing'
+)
+
+# Common Swedish cities and regions
+LOCATIONS = (
+    'Stockholm', 'Göteborg', 'Gothenburg', 'Malmö', 'Uppsala',
+    'Linköping', 'Örebro', 'Västerås', 'Helsingborg', 'Norrköping',
+    'Jönköping', 'Umeå', 'Lund', 'Sundsvall', 'Karlstad',
+    'Remote', 'Distans'
+)
+# Spellings reported under another canonical name
+_LOCATION_ALIASES = {'Gothenburg': 'Göteborg'}
+_LOCATION_CANONICAL = {
+    location.lower(): sys.intern(_LOCATION_ALIASES.get(location, location)) for location in LOCATIONS
+}
+# Matched against lowercased text, so no IGNORECASE needed; \b stops "Lund" hitting "Lundberg".
+# Stays on stdlib re: RE2's \b is ASCII-only and would not anchor "Malmö" or "Örebro"
+_LOCATION_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(location) for location in _LOCATION_CANONICAL) + r')\b'
+)
+
+# Lowercased keyword or alias -> canonical skill; aliases let "Postgres" or "K8s" count
+# towards the skill they abbreviate. Values are interned so every job's skill list shares
+# one string object per skill
+_SKILL_CANONICAL = {skill.lower(): sys.intern(skill) for skill in SKILL_KEYWORDS}
+for _skill, _aliases in SKILL_ALIASES.items():
+    if _skill in SKILL_KEYWORDS:
+        for _alias in _aliases:
+            _SKILL_CANONICAL.setdefault(_alias.lower(), sys.intern(_skill))
+
+# Punctuation that never belongs to a skill name becomes whitespace; + . # / - are kept
+# for C++, .NET, C#, CI/CD and C-Sharp
+_SKILL_TOKEN_TRANS = str.maketrans({c: ' ' for c in string.punctuation if c not in '+.#/-'})
+# Multi-word skills ("machine learning") are matched as token tuples, everything else
+# by set membership; whole tokens avoid "Go" in "Google"
+_SKILL_PHRASES = {
+    tuple(key.split()): skill for key, skill in _SKILL_CANONICAL.items() if ' ' in key
+}
+_SKILL_PHRASE_LENGTHS = sorted({len(words) for words in _SKILL_PHRASES}, reverse=True)
+_SKILL_PHRASE_STARTS = frozenset(words[0] for words in _SKILL_PHRASES)
+_SKILL_COMPOUND_SPLIT_RE = re.compile(r'[/-]')
+
+# Common patterns for company names: "hos/at/för/@ Company" or "Company söker/seeks/looking"
+_COMPANY_RE = linear_re.compile(
+    r'(?:(?:hos|at|för|@)\s+([A-Z][A-Za-z0-9\s&]+))'
+    r'|(?:([A-Z][A-Za-z0-9\s&]+)\s+(?:söker|seeks|looking))'
+)
+
+
+# RSS/Atom child elements (by local name) mapped to the entry keys _parse_entry reads
+_FEED_ENTRY_TAGS = frozenset({'item', 'entry'})
+_FEED_ENTRY_FIELDS = {
+    'title': 'title',
+    'description': 'summary',
+    'summary': 'summary',
+    'encoded': 'summary',
+    'content': 'summary',
+    'guid': 'id',
+    'id': 'id',
+    'pubDate': 'published',
+    'published': 'published',
+    'updated': 'published',
+    'date': 'published',
+}
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+
+def _iter_feed_entries(body: bytes) -> Iterator[Dict[str, str]]:
+    """Stream RSS/Atom entries as small dicts holding only the fields _parse_entry reads."""
+    for _, elem in ElementTree.iterparse(BytesIO(body), events=('end',)):
+        if _local_name(elem.tag) not in _FEED_ENTRY_TAGS:
+            continue
+        
+        entry = {}
+        for child in elem:
+            name = _local_name(child.tag)
+            text = (child.text or '').strip()
+            if name == 'link':
+                # Atom puts the URL in href; RSS puts it in the element text
+                href = child.get('href')
+                if href and child.get('rel', 'alternate') == 'alternate':
+                    entry.setdefault('link', href)
+                elif text:
+                    entry.setdefault('link', text)
+            elif text and name in _FEED_ENTRY_FIELDS:
+                entry.setdefault(_FEED_ENTRY_FIELDS[name], text)
+        
+        # Entries are consumed immediately, so release their subtree
+        elem.clear()
+        yield entry
+
+
+def _read_feed_entries(body: bytes) -> List[Dict[str, Any]]:
+    """Parse feed entries with the streaming parser, falling back to feedparser for malformed XML."""
+    try:
+        return list(_iter_feed_entries(body))
+    except ElementTree.ParseError as e:
+        logger.debug(f"Streaming feed parse failed ({e}), falling back to feedparser")
+    
+    feed = feedparser.parse(body)
+    if feed.bozo:
+        raise ValueError(f"Error parsing RSS feed: {feed.bozo_exception}")
+    return feed.entries
+
+
+# RFC 822 dates as used by RSS pubDate, e.g. "Mon, 06 Sep 2021 16:45:00 +0200"
+_RFC822_DATE_RE = linear_re.compile(
+    r'^(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+'
+    r'(\d{2}):(\d{2})(?::(\d{2}))?\s*(?:([+-])(\d{2})(\d{2})|GMT|UTC|UT|Z)?$'
+)
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+
+def _parse_date_string(raw: str) -> Optional[datetime]:
+    """Parse an RSS/Atom date string, trying the common formats before the generic parsers."""
+    match = _RFC822_DATE_RE.match(raw)
+    if match:
+        day, month, year, hour, minute, second, sign, tz_hours, tz_minutes = match.groups()
+        month_number = _MONTHS.get(month.lower())
+        if month_number:
+            offset = timedelta(0)
+            if sign:
+                offset = timedelta(hours=int(tz_hours), minutes=int(tz_minutes))
+                if sign == '-':
+                    offset = -offset
+            try:
+                local = datetime(int(year), month_number, int(day), int(hour), int(minute), int(second or 0))
+            except ValueError:
+                return None
+            return (local - offset).replace(tzinfo=timezone.utc)
+    
+    # ISO 8601 (Atom); fromisoformat is implemented in C
+    try:
+        return _as_utc(datetime.fromisoformat(raw))
+    except ValueError:
+        pass
+    
+    try:
+        return _as_utc(parsedate_to_datetime(raw))
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _parse_published(entry: Any) -> Optional[datetime]:
+    """Return the entry's publish time as an aware UTC datetime."""
+    # feedparser has already parsed the date into a UTC struct_time
+    parsed = entry.get('published_parsed')
+    if parsed:
+        return datetime(*parsed[:6], tzinfo=timezone.utc)
+    
+    raw = entry.get('published')
+    return _parse_date_string(raw) if raw else None
+
+
+def _first(entry: Dict[str, Any], *keys: str) -> Any:
+    """Return the first non-empty value among keys, or ''."""
+    # dict.get reads the underlying dict directly, skipping FeedParserDict's key-alias
+    # resolution; callers list the aliases they accept instead
+    for key in keys:
+        value = dict.get(entry, key)
+        if value:
+            return value
+    return ''
+
+
+def _parse_entry_pure(entry: Dict[str, Any], source_name: str, feed_url: str) -> Optional[JobIn]:
+    """Parse RSS entry into JobIn model. Module-level so it can run in a worker process."""
+    try:
+        # Extract basic fields
+        title = _first(entry, 'title')
+        url = _first(entry, 'link')
+        description = _first(entry, 'summary', 'description')
+        
+        # Generate external ID from URL or guid
+        external_id = _first(entry, 'id', 'guid') or url
+        if not external_id:
+            # Nothing to dedupe on
+            return None
+        
+        # Parse published date
+        published = _parse_published(entry)
+        
+        # Extract company from title or description (pattern relies on capitalisation)
+        company = _extract_company(title, description)
+        
+        # Lowercase once and share with the keyword helpers
+        description_lower = description.lower()
+        
+        # Extract location
+        location = _extract_location(description_lower)
+        
+        # Extract skills
+        skills = _extract_skills(description_lower)
+        
+        # Create raw data. A plain literal is built presized in one step and its values are
+        # references, so a template copy or dataclass would only add work
+        raw_data = {
+            'title': title,
+            'url': url,
+            'description': description,
+            'published': published.isoformat() if published else None,
+            'source': 'rss',
+            'feed_url': feed_url,
+            'company': company
+        }
+        
+        # Every field is built with its declared type above, so skip pydantic validation
+        return JobIn.model_construct(
+            job_uid=external_id,
+            source=source_name,
+            title=title,
+            description=description,
+            skills=skills,
+            location_city=location,
+            url=url,
+            posted_at=published,
+            raw_json=raw_data
+        )
+        
+    except Exception as e:
+        logger.error(f"Error parsing RSS entry: {e}")
+        return None
+
+
+def _parse_entries_pure(entries: List[Dict[str, Any]], source_name: str, feed_url: str) -> List[JobIn]:
+    """Parse a chunk of entries, dropping unusable ones; one process-pool task per chunk."""
+    return [job for job in (_parse_entry_pure(entry, source_name, feed_url) for entry in entries) if job]
+
+
+def _extract_company(title: str, description: str) -> Optional[str]:
+    """Extract company name from title or description."""
+    for text in (title, description):
+        match = _COMPANY_RE.search(text)
+        if match:
+            return (match.group(1) or match.group(2)).strip()
+    
+    return None
+
+
+def _extract_location(text_lower: str) -> Optional[str]:
+    """Extract location from already-lowercased text."""
+    match = _LOCATION_RE.search(text_lower)
+    return _LOCATION_CANONICAL[match.group(1)] if match else None
+
+
+def _extract_skills(text_lower: str) -> List[str]:
+    """Extract technical skills from already-lowercased text."""
+    # One C-level translate/split, then dict lookups per token; hits keep first-seen order
+    tokens = [token.rstrip('.') for token in text_lower.translate(_SKILL_TOKEN_TRANS).split()]
+    found = {}
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        
+        # Prefer the phrase so "SQL Server" isn't also reported as "SQL"
+        if token in _SKILL_PHRASE_STARTS:
+            phrase_length = 0
+            for length in _SKILL_PHRASE_LENGTHS:
+                skill = _SKILL_PHRASES.get(tuple(tokens[i:i + length]))
+                if skill:
+                    found[skill] = None
+                    phrase_length = length
+                    break
+            if phrase_length:
+                i += phrase_length
+                continue
+        
+        skill = _SKILL_CANONICAL.get(token)
+        if skill:
+            found[skill] = None
+        elif '/' in token or '-' in token:
+            # "python/django", "react-native"
+            for part in _SKILL_COMPOUND_SPLIT_RE.split(token):
+                skill = _SKILL_CANONICAL.get(part)
+                if skill:
+                    found[skill] = None
+        i += 1
+    
+    return list(found)
+
+
+# Feeds with at least this many entries are parsed in the caller's process pool
+PROCESS_POOL_MIN_ENTRIES = int(os.getenv("RSS_PROCESS_POOL_MIN_ENTRIES", "200"))
+
 
 class RSSIngester(BaseIngester):
     """Ingest jobs from RSS feeds."""
     
-    def __init__(self, feed_url: str, source_name: str):
-        super().__init__(source_name)
-        self.feed_url = feed_url
+    def __init__(self, feed_url: str, source_name: str,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None,
+                 client: Optional[httpx.AsyncClient] = None,
+                 executor: Optional[Executor] = None):
+        # Interned: every job and raw_data dict from this feed references these
+        super().__init__(sys.intern(source_name), client=client)
+        self.feed_url = sys.intern(feed_url)
+        # Process pool for large feeds, owned by the caller; without one entries parse inline
+        self.executor = executor
+        # Validators from the caller's last saved run; replaced only once a fetch parses
+        self.etag = etag
+        self.last_modified = last_modified
+        # Set when the last fetch_jobs() call got 304 Not Modified
+        self.not_modified = False
+        # Set when the last fetch_jobs() call downloaded and parsed the feed
+        self.fetched = False
+    
+    def _conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+    
+    async def _unchanged_since_last_fetch(self) -> bool:
+        """HEAD the feed and compare validators, for servers that ignore conditional GETs."""
+        if not (self.etag or self.last_modified):
+            return False
+        try:
+            response = await self.client.head(self.feed_url, follow_redirects=True)
+        except httpx.HTTPError:
+            return False
+        if response.status_code != 200:
+            # HEAD not supported; let the GET decide
+            return False
+        return (
+            response.headers.get('ETag') == self.etag
+            and response.headers.get('Last-Modified') == self.last_modified
+        )
     
     async def fetch_jobs(self) -> List[JobIn]:
-        """Fetch jobs from RSS feed."""
+        """Fetch jobs from RSS feed; returns [] without parsing when the feed is unchanged."""
+        self.not_modified = False
+        self.fetched = False
         try:
-            # Parse RSS feed
-            feed = feedparser.parse(self.feed_url)
+            if await self._unchanged_since_last_fetch():
+                self.not_modified = True
+                logger.info(f"RSS feed {self.feed_url} unchanged according to HEAD")
+                return []
             
-            if feed.bozo:
-                logger.error(f"Error parsing RSS feed: {feed.bozo_exception}")
+            # Download with the async client so other feeds and requests keep running
+            response = await self.client.get(
+                self.feed_url,
+                headers=self._conditional_headers(),
+                follow_redirects=True
+            )
+            if response.status_code == 304:
+                self.not_modified = True
+                logger.info(f"RSS feed {self.feed_url} not modified since last fetch")
                 return []
+            response.raise_for_status()
+            
+            # XML parsing is synchronous; run it in a worker thread
+            entries = await asyncio.to_thread(_read_feed_entries, response.content)
             
-            jobs = []
-            for entry in feed.entries:
-                job = await self._parse_entry(entry)
-                if job:
-                    jobs.append(job)
+            # Large feeds are parsed across processes so regex work doesn't hold the GIL
+            # for every other ingester; small ones aren't worth the pickling
+            if self.executor is not None and len(entries) >= PROCESS_POOL_MIN_ENTRIES:
+                # One chunk per worker, so pickling is paid per chunk rather than per entry
+                workers = getattr(self.executor, '_max_workers', None) or os.cpu_count() or 1
+                chunk_size = -(-len(entries) // workers)
+                loop = asyncio.get_running_loop()
+                chunks = await asyncio.gather(*(
+                    loop.run_in_executor(
+                        self.executor, _parse_entries_pure,
+                        [dict(entry) for entry in entries[i:i + chunk_size]], self.source_name, self.feed_url
+                    )
+                    for i in range(0, len(entries), chunk_size)
+                ))
+                jobs = [job for chunk in chunks for job in chunk]
+            else:
+                jobs = _parse_entries_pure(entries, self.source_name, self.feed_url)
+            
+            # Adopt the new validators only after parsing; the caller persists them once
+            # the jobs are saved, so a failed run is refetched in full next time
+            self.etag = response.headers.get('ETag')
+            self.last_modified = response.headers.get('Last-Modified')
+            self.fetched = True
             
             return jobs
             
         except Exception as e:
             logger.error(f"Error fetching RSS feed {self.feed_url}: {e}")
             return []
+
+
+async def fetch_feeds(ingesters: List[RSSIngester], max_concurrency: int = 8) -> List[JobIn]:
+    """Fetch several RSS feeds concurrently and return all parsed jobs."""
+    semaphore = asyncio.Semaphore(max_concurrency)
     
-    async def _parse_entry(self, entry: Any) -> Optional[JobIn]:
-        """Parse RSS entry into JobIn model."""
-        try:
-            # Extract basic fields
-            title = entry.get('title', '')
-            url = entry.get('link', '')
-            description = entry.get('summary', '') or entry.get('description', '')
-            
-            # Generate external ID from URL or guid
-            external_id = entry.get('id') or entry.get('guid') or url
-            
-            # Parse published date
-            published = None
-            if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                published = datetime.fromtimestamp(
-                    feedparser._parse_date(entry.published).timestamp(),
-                    tz=timezone.utc
-                )
-            
-            # Extract company from title or description
-            company = self._extract_company(title, description)
-            
-            # Extract location
-            location = self._extract_location(description)
-            
-            # Extract skills
-            skills = self._extract_skills(description)
-            
-            # Create raw data
-            raw_data = {
-                'title': title,
-                'url': url,
-                'description': description,
-                'published': published.isoformat() if published else None,
-                'source': 'rss',
-                'feed_url': self.feed_url
-            }
-            
-            return JobIn(
-                external_id=external_id,
-                source=self.source_name,
-                title=title,
-                company=company,
-                location=location,
-                description=description,
-                skills=skills,
-                url=url,
-                raw_data=raw_data
-            )
-            
-        except Exception as e:
-            logger.error(f"Error parsing RSS entry: {e}")
-            return None
-    
-    def _extract_company(self, title: str, description: str) -> Optional[str]:
-        """Extract company name from title or description."""
-        # Common patterns for company names
-        patterns = [
-            r'(?:hos|at|för|@)\s+([A-Z][A-Za-z0-9\s&]+)',
-            r'([A-Z][A-Za-z0-9\s&]+)\s+(?:söker|seeks|looking)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, title + ' ' + description)
-            if match:
-                return match.group(1).strip()
-        
-        return None
-    
-    def _extract_location(self, text: str) -> Optional[str]:
-        """Extract location from text."""
-        # Common Swedish cities and regions
-        locations = [
-            'Stockholm', 'Göteborg', 'Gothenburg', 'Malmö', 'Uppsala',
-            'Linköping', 'Örebro', 'Västerås', 'Helsingborg', 'Norrköping',
-            'Jönköping', 'Umeå', 'Lund', 'Sundsvall', 'Karlstad',
-            'Remote', 'Distans'
-        ]
-        
-        text_lower = text.lower()
-        for location in locations:
-            if location.lower() in text_lower:
-                return location
-        
-        return None
+    async def _fetch(ingester: RSSIngester) -> List[JobIn]:
+        async with semaphore:
+            return await ingester.fetch_jobs()
     
-    def _extract_skills(self, text: str) -> List[str]:
-        """Extract technical skills from text."""
-        # Common technical skills and technologies
-        skill_keywords = [
-            # Programming languages
-            'Python', 'Java', 'JavaScript', 'TypeScript', 'C#', 'C++',
-            'Go', 'Rust', 'Kotlin', 'Swift', 'Ruby', 'PHP', 'Scala',
-            
-            # Frameworks
-            'React', 'Angular', 'Vue', 'Django', 'Flask', 'FastAPI',
-            'Spring', 'Node.js', '.NET', 'Rails', 'Laravel',
-            
-            # Databases
-            'PostgreSQL', 'MySQL', 'MongoDB', 'Redis', 'Elasticsearch',
-            'SQL', 'NoSQL', 'Oracle', 'SQL Server',
-            
-            # Cloud & DevOps
-            'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes', 'Jenkins',
-            'CI/CD', 'Terraform', 'Ansible', 'Linux',
-            
-            # Data & AI
-            'Machine Learning', 'AI', 'Data Science', 'TensorFlow',
-            'PyTorch', 'Pandas', 'NumPy', 'Spark', 'Hadoop',
-            
-            # Other
-            'REST', 'GraphQL', 'Microservices', 'Agile', 'Scrum',
-            'Git', 'DevOps', 'Cloud', 'Security', 'Testing'
-        ]
-        
-        found_skills = []
-        text_lower = text.lower()
-        
-        for skill in skill_keywords:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        
-        return found_skills
\ No newline at end of file
+    results = await asyncio.gather(*(_fetch(ingester) for ingester in ingesters))
+    return [job for jobs in results for job in jobs]
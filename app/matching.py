@@ -1,15 +1,149 @@
 from typing import List, Dict, Any, Optional, Tuple
 from uuid import UUID
-from decimal import Decimal
+import re
+from itertools import chain
+import asyncio
+import heapq
 import logging
 from difflib import SequenceMatcher
 
-from app.models import Job, Consultant, JobConsultantMatch, MatchReason
+from app.models import Job, Consultant, JobConsultantMatch, MatchReason, OnsiteMode
 from app.repo import DatabaseRepository
-from app.embeddings import EmbeddingService
+from app.embeddings import EmbeddingService, JOB_TEXT_FIELDS, CONSULTANT_TEXT_FIELDS
+from app.config import settings
+
+# RapidFuzz is optional; difflib gives comparable scores, just slower. The scorers differ
+# (Indel distance vs matching blocks), so a pair near the threshold can go either way
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
 
 logger = logging.getLogger(__name__)
 
+# Minimum similarity for two differently spelled skills to count as the same
+FUZZY_SKILL_THRESHOLD = 0.8
+
+# Cities counted as the same region for geo matching
+_SWEDISH_REGIONS = {
+    'stockholm': ['stockholm', 'solna', 'sundbyberg', 'täby', 'nacka', 'järfälla'],
+    'gothenburg': ['gothenburg', 'göteborg', 'mölndal', 'partille', 'kungsbacka'],
+    'malmö': ['malmö', 'lund', 'helsingborg', 'landskrona', 'eslöv'],
+    'uppsala': ['uppsala', 'enköping', 'knivsta', 'östhammar']
+}
+_CITY_TO_REGION = {city: region for region, cities in _SWEDISH_REGIONS.items() for city in cities}
+
+
+# Seniority levels as bits, so a profile's levels are computed once and compared with a table lookup
+_SENIOR, _MID, _JUNIOR = 1, 2, 4
+# Substring alternations (no word boundaries), so "mid-level" and "senior/lead" classify
+_SENIORITY_PATTERNS = (
+    (_SENIOR, re.compile('senior|lead|principal|architect|expert')),
+    (_MID, re.compile('mid|intermediate|experienced|regular')),
+    (_JUNIOR, re.compile('junior|entry|trainee|intern|graduate')),
+)
+
+
+def _seniority_bits(seniority: str) -> int:
+    """Bitmask of the levels whose terms appear in a lowercased seniority."""
+    bits = 0
+    for bit, pattern in _SENIORITY_PATTERNS:
+        if pattern.search(seniority):
+            bits |= bit
+    return bits
+
+
+def _seniority_score(job_bits: int, cons_bits: int) -> float:
+    """Score for seniorities that differ: shared level 0.9, senior/mid 0.6, otherwise 0.3."""
+    if job_bits & cons_bits:
+        return 0.9
+    if (job_bits & _SENIOR and cons_bits & _MID) or (job_bits & _MID and cons_bits & _SENIOR):
+        return 0.6
+    return 0.3
+
+
+# Indexed by job_bits << 3 | cons_bits
+_SENIORITY_LUT = tuple(_seniority_score(job_bits, cons_bits) for job_bits in range(8) for cons_bits in range(8))
+
+# Geo base score by (job, consultant) onsite mode when neither side is remote
+_ONSITE_BASE_SCORES = {
+    (OnsiteMode.ONSITE, OnsiteMode.ONSITE): 0.8,
+    (OnsiteMode.ONSITE, OnsiteMode.HYBRID): 0.3,
+    (OnsiteMode.HYBRID, OnsiteMode.ONSITE): 0.7,
+    (OnsiteMode.HYBRID, OnsiteMode.HYBRID): 0.7,
+}
+
+
+def _region_for_city(city: Optional[str]) -> Optional[str]:
+    """Map a lowercased city to its Swedish region, or None."""
+    if not city:
+        return None
+    region = _CITY_TO_REGION.get(city)
+    if region:
+        return region
+    # Free-text locations such as "solna, stockholm"; the last matching region wins
+    for candidate_region, cities in _SWEDISH_REGIONS.items():
+        if any(c in city for c in cities):
+            region = candidate_region
+    return region
+
+
+def _fuzzy_skill_match(skill: str, candidates: List[str]) -> Optional[str]:
+    """Return the most similar candidate if its similarity exceeds FUZZY_SKILL_THRESHOLD."""
+    if process is not None:
+        result = process.extractOne(
+            skill, candidates, scorer=fuzz.ratio, score_cutoff=FUZZY_SKILL_THRESHOLD * 100
+        )
+        # score_cutoff is inclusive; keep the strict > the difflib path uses
+        if result and result[1] > FUZZY_SKILL_THRESHOLD * 100:
+            return result[0]
+        return None
+    
+    best, best_ratio = None, FUZZY_SKILL_THRESHOLD
+    for candidate in candidates:
+        matcher = SequenceMatcher(None, skill, candidate)
+        # The quick ratios are cheap upper bounds on ratio(); like extractOne, the first
+        # of equally good candidates wins
+        if (matcher.real_quick_ratio() > best_ratio
+                and matcher.quick_ratio() > best_ratio):
+            ratio = matcher.ratio()
+            if ratio > best_ratio:
+                best, best_ratio = candidate, ratio
+    return best
+
+
+def _match_skills(job_skills: List[str], consultant_skills: List[str]) -> List[Tuple[str, Optional[str]]]:
+    """Pair each normalized job skill with the consultant skill it matches (exact first), or None."""
+    consultant_set = set(consultant_skills)
+    pairs = []
+    for skill in job_skills:
+        if skill in consultant_set:
+            pairs.append((skill, skill))
+        else:
+            pairs.append((skill, _fuzzy_skill_match(skill, consultant_skills) if consultant_skills else None))
+    return pairs
+
+
+class _ProfileView:
+    """Lowercased match fields of a job or consultant, computed once per matching run."""
+    __slots__ = (
+        'skills', 'languages', 'language_set', 'city', 'region', 'country',
+        'seniority', 'seniority_bits', 'role', 'onsite'
+    )
+    
+    def __init__(self, profile):
+        self.skills = [s.lower().strip() for s in profile.skills or []]
+        self.languages = [l.lower().strip() for l in profile.languages or []]
+        self.language_set = frozenset(self.languages)
+        self.city = profile.location_city.lower() if profile.location_city else None
+        self.region = _region_for_city(self.city)
+        self.country = profile.location_country.lower() if profile.location_country else None
+        self.seniority = profile.seniority.lower() if profile.seniority else None
+        self.seniority_bits = _seniority_bits(self.seniority) if self.seniority else 0
+        self.role = profile.role.lower() if profile.role else None
+        # Normalized to the enum member so the geo check compares by identity
+        self.onsite = OnsiteMode(profile.onsite_mode) if profile.onsite_mode else None
+
 
 class MatchingService:
     # Weights for different matching components
@@ -22,6 +156,8 @@ class MatchingService:
     def __init__(self, db_repo: DatabaseRepository, embedding_service: EmbeddingService):
         self.db = db_repo
         self.embeddings = embedding_service
+        # Bounds how many jobs are matched (and hold DB connections) at once
+        self._semaphore = asyncio.Semaphore(settings.matching_concurrency)
     
     async def run_matching(
         self,
@@ -32,109 +168,165 @@ class MatchingService:
     ) -> List[JobConsultantMatch]:
         """Run matching algorithm for specified jobs and consultants."""
         
-        # Get jobs to match
+        # Repeated ids would match, and upsert, the same pair twice
+        job_ids = list(dict.fromkeys(job_ids)) if job_ids else job_ids
+        consultant_ids = list(dict.fromkeys(consultant_ids)) if consultant_ids else consultant_ids
+        
+        # Get jobs to match, in the order requested
         if job_ids:
-            jobs = [await self.db.get_job(job_id) for job_id in job_ids]
-            jobs = [j for j in jobs if j]
+            jobs_by_id = {j.job_id: j for j in await self.db.get_jobs_by_ids(job_ids)}
+            jobs = [jobs_by_id[job_id] for job_id in job_ids if job_id in jobs_by_id]
         else:
             # Get recent jobs
             jobs = await self.db.get_jobs(limit=100)
         
         # Get consultants to match
         if consultant_ids:
-            consultants = [await self.db.get_consultant(c_id) for c_id in consultant_ids]
-            consultants = [c for c in consultants if c]
+            consultants_by_id = {c.consultant_id: c for c in await self.db.get_consultants_by_ids(consultant_ids)}
+            consultants = [consultants_by_id[c_id] for c_id in consultant_ids if c_id in consultants_by_id]
         else:
             # Get all active consultants
             consultants = await self.db.get_consultants(active_only=True, limit=100)
         
-        matches = []
+        await self._ensure_embeddings(jobs, consultants)
         
-        for job in jobs:
-            job_matches = await self._match_job_to_consultants(
-                job, consultants, min_score, max_results
-            )
-            matches.extend(job_matches)
+        # Consultant fields are normalized once for the whole run, not once per job
+        consultant_views = [(c, _ProfileView(c)) for c in consultants]
         
-        return matches
+        job_matches = await asyncio.gather(*(
+            self._match_job_to_consultants(job, consultant_views, min_score, max_results)
+            for job in jobs
+        ))
+        
+        return list(chain.from_iterable(job_matches))
     
     async def _match_job_to_consultants(
         self,
         job: Job,
-        consultants: List[Consultant],
+        consultant_views: List[Tuple[Consultant, _ProfileView]],
         min_score: float,
         max_results: int
     ) -> List[JobConsultantMatch]:
-        """Match a single job to multiple consultants."""
-        
-        # Get job embedding
-        job_embedding = await self.db.get_job_embedding(job.job_id)
-        if not job_embedding:
-            # Create embedding if not exists
-            job_text = self.embeddings.prepare_job_text(job.model_dump())
-            job_embedding = await self.embeddings.create_embedding(job_text)
-            await self.db.store_job_embedding(job.job_id, job_embedding)
-        
-        scored_matches = []
-        
-        for consultant in consultants:
-            # Get consultant embedding
-            consultant_embedding = await self.db.get_consultant_embedding(consultant.consultant_id)
-            if not consultant_embedding:
-                # Create embedding if not exists
-                consultant_text = self.embeddings.prepare_consultant_text(consultant.model_dump())
-                consultant_embedding = await self.embeddings.create_embedding(consultant_text)
-                await self.db.store_consultant_embedding(consultant.consultant_id, consultant_embedding)
+        """Match a single job to multiple consultants; embeddings must already exist (see _ensure_embeddings)."""
+        async with self._semaphore:
+            return await self._rank_and_store_matches(job, consultant_views, min_score, max_results)
+    
+    async def _rank_and_store_matches(
+        self,
+        job: Job,
+        consultant_views: List[Tuple[Consultant, _ProfileView]],
+        min_score: float,
+        max_results: int
+    ) -> List[JobConsultantMatch]:
+        """Score consultants for one job and upsert the top max_results matches."""
+        
+        # Cosine similarity is computed by pgvector, so vectors never leave the database
+        consultant_ids = [consultant.consultant_id for consultant, _ in consultant_views]
+        cosine_scores = await self.db.get_embedding_similarities(job.job_id, consultant_ids)
+        
+        if max_results <= 0:
+            return []
+        
+        job_view = _ProfileView(job)
+        
+        # The other components add at most their weights, so below this cosine a
+        # consultant can't reach min_score even with perfect skills, role, language and geo
+        max_other_score = self.WEIGHT_SKILLS + self.WEIGHT_ROLE + self.WEIGHT_LANGUAGE + self.WEIGHT_GEO
+        cosine_floor = (min_score - max_other_score) / self.WEIGHT_COSINE
+        
+        # Visit consultants best cosine first, so once the bound can't beat the kept matches we can stop
+        candidates = sorted(
+            (
+                (cosine_score, index, consultant, consultant_view)
+                for index, (consultant, consultant_view) in enumerate(consultant_views)
+                if (cosine_score := cosine_scores.get(consultant.consultant_id, 0.0)) >= cosine_floor
+            ),
+            key=lambda c: (-c[0], c[1])
+        )
+        
+        # Min-heap of the best max_results matches; -index makes earlier consultants win ties
+        top_heap = []
+        for cosine_score, index, consultant, consultant_view in candidates:
+            upper_bound = self.WEIGHT_COSINE * cosine_score + max_other_score
+            if len(top_heap) >= max_results and upper_bound < top_heap[0][0]:
+                break
             
             # Calculate match scores
-            scores = self._calculate_match_scores(job, consultant, job_embedding, consultant_embedding)
+            scores, skill_pairs = self._calculate_match_scores(
+                job, consultant, job_view, consultant_view, cosine_score
+            )
+            if scores['total'] < min_score:
+                continue
             
-            if scores['total'] >= min_score:
-                reason = self._generate_match_reason(job, consultant, scores)
-                scored_matches.append((consultant, scores, reason))
-        
-        # Sort by total score and take top results
-        scored_matches.sort(key=lambda x: x[1]['total'], reverse=True)
-        top_matches = scored_matches[:max_results]
+            entry = (scores['total'], -index, consultant, scores, skill_pairs)
+            if len(top_heap) < max_results:
+                heapq.heappush(top_heap, entry)
+            elif entry[:2] > top_heap[0][:2]:
+                heapq.heappushpop(top_heap, entry)
+        
+        # Highest score first; reasons are only built for matches that are kept
+        top_heap.sort(key=lambda e: e[:2], reverse=True)
+        top_matches = [
+            (consultant, scores, self._generate_match_reason(job, consultant, scores, skill_pairs))
+            for _, _, consultant, scores, skill_pairs in top_heap
+        ]
         
         # Store matches in database
-        matches = []
-        for consultant, scores, reason in top_matches:
-            match = await self.db.upsert_match(
-                job_id=job.job_id,
-                consultant_id=consultant.consultant_id,
-                score=scores['total'],
-                reason_json=reason.model_dump()
+        return await self.db.upsert_matches([
+            (job.job_id, consultant.consultant_id, scores['total'], reason.model_dump())
+            for consultant, scores, reason in top_matches
+        ])
+    
+    async def _ensure_embeddings(self, jobs: List[Job], consultants: List[Consultant]):
+        """Create and store embeddings for any jobs and consultants that don't have one yet."""
+        embedded_jobs = await self.db.get_embedded_job_ids([j.job_id for j in jobs])
+        missing_jobs = [j for j in jobs if j.job_id not in embedded_jobs]
+        if missing_jobs:
+            # Text building for a whole batch runs in one worker thread, off the event loop
+            job_texts = await asyncio.to_thread(
+                lambda: [self.embeddings.prepare_job_text(j.model_dump(include=JOB_TEXT_FIELDS)) for j in missing_jobs]
             )
-            matches.append(match)
-        
-        return matches
+            job_embeddings = await self.embeddings.get_or_create_embeddings(job_texts)
+            await self.db.store_job_embeddings([
+                (job.job_id, embedding)
+                for job, embedding in zip(missing_jobs, job_embeddings) if embedding
+            ])
+        
+        embedded_consultants = await self.db.get_embedded_consultant_ids([c.consultant_id for c in consultants])
+        missing_consultants = [c for c in consultants if c.consultant_id not in embedded_consultants]
+        if missing_consultants:
+            consultant_texts = await asyncio.to_thread(
+                lambda: [self.embeddings.prepare_consultant_text(c.model_dump(include=CONSULTANT_TEXT_FIELDS))
+                          for c in missing_consultants]
+            )
+            consultant_embeddings = await self.embeddings.get_or_create_embeddings(consultant_texts)
+            await self.db.store_consultant_embeddings([
+                (consultant.consultant_id, embedding)
+                for consultant, embedding in zip(missing_consultants, consultant_embeddings) if embedding
+            ])
     
     def _calculate_match_scores(
         self,
         job: Job,
         consultant: Consultant,
-        job_embedding: List[float],
-        consultant_embedding: List[float]
-    ) -> Dict[str, float]:
-        """Calculate all matching scores between job and consultant."""
-        
-        # Cosine similarity
-        cosine_score = self.embeddings.cosine_similarity(job_embedding, consultant_embedding)
+        job_view: _ProfileView,
+        consultant_view: _ProfileView,
+        cosine_score: float
+    ) -> Tuple[Dict[str, float], List[Tuple[str, Optional[str]]]]:
+        """Calculate all matching scores between job and consultant, plus the skill pairing behind them."""
         
         # Skills match
-        skills_score = self._calculate_skills_match(job.skills, consultant.skills)
+        skill_pairs = _match_skills(job_view.skills, consultant_view.skills)
+        skills_score = self._calculate_skills_match(skill_pairs, bool(consultant_view.skills))
         
         # Role match
-        role_score = self._calculate_role_match(job, consultant)
+        role_score = self._calculate_role_match(job_view, consultant_view)
         
         # Language match
-        language_score = self._calculate_language_match(
-            job.languages, consultant.languages
-        )
+        language_score = self._calculate_language_match(job_view, consultant_view)
         
         # Geographic match
-        geo_score = self._calculate_geo_match(job, consultant)
+        geo_score = self._calculate_geo_match(job_view, consultant_view)
         
         # Calculate weighted total
         total_score = (
@@ -152,74 +344,43 @@ class MatchingService:
             'role': role_score,
             'language': language_score,
             'geo': geo_score
-        }
+        }, skill_pairs
     
     def _calculate_skills_match(
         self,
-        job_skills: List[str],
-        consultant_skills: List[str]
+        skill_pairs: List[Tuple[str, Optional[str]]],
+        consultant_has_skills: bool
     ) -> float:
-        """Calculate skills matching score."""
-        if not job_skills:
+        """Calculate skills matching score from _match_skills() pairs."""
+        if not skill_pairs:
             return 1.0  # No skills required
         
-        if not consultant_skills:
+        if not consultant_has_skills:
             return 0.0  # Skills required but consultant has none
         
-        # Normalize skills for comparison
-        job_skills_lower = [s.lower().strip() for s in job_skills]
-        consultant_skills_lower = [s.lower().strip() for s in consultant_skills]
-        
         matches = 0
-        for job_skill in job_skills_lower:
-            # Check exact match or fuzzy match
-            for consultant_skill in consultant_skills_lower:
-                if job_skill == consultant_skill:
-                    matches += 1
-                    break
-                elif SequenceMatcher(None, job_skill, consultant_skill).ratio() > 0.8:
-                    matches += 0.8  # Partial credit for fuzzy match
-                    break
-        
-        return min(1.0, matches / len(job_skills_lower))
+        for job_skill, consultant_skill in skill_pairs:
+            if consultant_skill == job_skill:
+                matches += 1
+            elif consultant_skill:
+                matches += 0.8  # Partial credit for fuzzy match
+        
+        return min(1.0, matches / len(skill_pairs))
     
-    def _calculate_role_match(self, job: Job, consultant: Consultant) -> float:
+    def _calculate_role_match(self, job_view: _ProfileView, consultant_view: _ProfileView) -> float:
         """Calculate role/seniority matching score."""
         # Direct seniority match if both have it
-        if job.seniority and consultant.seniority:
-            job_sen = job.seniority.lower()
-            cons_sen = consultant.seniority.lower()
-            
+        if job_view.seniority and consultant_view.seniority:
             # Exact match
-            if job_sen == cons_sen:
+            if job_view.seniority == consultant_view.seniority:
                 return 1.0
             
             # Close matches
-            senior_terms = ['senior', 'lead', 'principal', 'architect', 'expert']
-            mid_terms = ['mid', 'intermediate', 'experienced', 'regular']
-            junior_terms = ['junior', 'entry', 'trainee', 'intern', 'graduate']
-            
-            job_is_senior = any(term in job_sen for term in senior_terms)
-            job_is_mid = any(term in job_sen for term in mid_terms)
-            job_is_junior = any(term in job_sen for term in junior_terms)
-            
-            cons_is_senior = any(term in cons_sen for term in senior_terms)
-            cons_is_mid = any(term in cons_sen for term in mid_terms)
-            cons_is_junior = any(term in cons_sen for term in junior_terms)
-            
-            if (job_is_senior and cons_is_senior) or \
-               (job_is_mid and cons_is_mid) or \
-               (job_is_junior and cons_is_junior):
-                return 0.9
-            elif (job_is_senior and cons_is_mid) or \
-                 (job_is_mid and cons_is_senior):
-                return 0.6
-            else:
-                return 0.3
+            return _SENIORITY_LUT[job_view.seniority_bits << 3 | consultant_view.seniority_bits]
         
         # Role-based matching if seniority not available
-        if job.role and consultant.role:
-            if job.role.lower() == consultant.role.lower():
+        if job_view.role and consultant_view.role:
+            if job_view.role == consultant_view.role:
                 return 0.8
             # Check for similar roles using canonical roles
             return 0.5
@@ -228,74 +389,46 @@ class MatchingService:
     
     def _calculate_language_match(
         self,
-        job_languages: List[str],
-        consultant_languages: List[str]
+        job_view: _ProfileView,
+        consultant_view: _ProfileView
     ) -> float:
         """Calculate language requirements matching score."""
-        if not job_languages:
+        if not job_view.languages:
             return 1.0  # No language requirements
         
-        if not consultant_languages:
+        if not consultant_view.languages:
             return 0.0  # Languages required but consultant has none listed
         
-        job_langs_lower = [l.lower().strip() for l in job_languages]
-        consultant_langs_lower = [l.lower().strip() for l in consultant_languages]
-        
-        matches = sum(1 for lang in job_langs_lower if lang in consultant_langs_lower)
+        matches = sum(1 for lang in job_view.languages if lang in consultant_view.language_set)
         
-        return matches / len(job_langs_lower)
+        return matches / len(job_view.languages)
     
-    def _calculate_geo_match(
-        self,
-        job: Job,
-        consultant: Consultant
-    ) -> float:
+    def _calculate_geo_match(self, job_view: _ProfileView, consultant_view: _ProfileView) -> float:
         """Calculate geographic matching score."""
         # Check onsite mode compatibility first
-        if job.onsite_mode and consultant.onsite_mode:
-            if job.onsite_mode == 'remote' or consultant.onsite_mode == 'remote':
+        if job_view.onsite and consultant_view.onsite:
+            if job_view.onsite is OnsiteMode.REMOTE or consultant_view.onsite is OnsiteMode.REMOTE:
                 return 0.9  # Remote work makes location less important
-            elif job.onsite_mode == 'hybrid' and consultant.onsite_mode in ['hybrid', 'onsite']:
-                base_score = 0.7
-            elif job.onsite_mode == consultant.onsite_mode:
-                base_score = 0.8
-            else:
-                base_score = 0.3
+            base_score = _ONSITE_BASE_SCORES[job_view.onsite, consultant_view.onsite]
         else:
             base_score = 0.5
         
         # Location matching
-        if job.location_city and consultant.location_city:
-            job_city = job.location_city.lower()
-            cons_city = consultant.location_city.lower()
+        if job_view.city and consultant_view.city:
+            job_city = job_view.city
+            cons_city = consultant_view.city
             
             # Exact city match
             if job_city == cons_city:
                 return min(1.0, base_score + 0.3)
             
             # Same region check for Swedish cities
-            swedish_regions = {
-                'stockholm': ['stockholm', 'solna', 'sundbyberg', 'täby', 'nacka', 'järfälla'],
-                'gothenburg': ['gothenburg', 'göteborg', 'mölndal', 'partille', 'kungsbacka'],
-                'malmö': ['malmö', 'lund', 'helsingborg', 'landskrona', 'eslöv'],
-                'uppsala': ['uppsala', 'enköping', 'knivsta', 'östhammar']
-            }
-            
-            job_region = None
-            cons_region = None
-            
-            for region, cities in swedish_regions.items():
-                if any(city in job_city for city in cities):
-                    job_region = region
-                if any(city in cons_city for city in cities):
-                    cons_region = region
-            
-            if job_region and cons_region and job_region == cons_region:
+            if job_view.region and job_view.region == consultant_view.region:
                 return min(1.0, base_score + 0.2)
         
         # Country match
-        if job.location_country and consultant.location_country:
-            if job.location_country.lower() == consultant.location_country.lower():
+        if job_view.country and consultant_view.country:
+            if job_view.country == consultant_view.country:
                 return min(1.0, base_score + 0.1)
         
         return base_score
@@ -304,30 +437,24 @@ class MatchingService:
         self,
         job: Job,
         consultant: Consultant,
-        scores: Dict[str, float]
+        scores: Dict[str, float],
+        skill_pairs: List[Tuple[str, Optional[str]]]
     ) -> MatchReason:
         """Generate human-readable reason for the match."""
         
         # Find matched and missing skills
-        job_skills_lower = [s.lower() for s in job.skills] if job.skills else []
-        consultant_skills_lower = [s.lower() for s in consultant.skills] if consultant.skills else []
+        job_skills_lower = [skill for skill, _ in skill_pairs]
         
         skills_matched = []
         skills_missing = []
         
-        for skill in job_skills_lower:
-            if skill in consultant_skills_lower:
+        for skill, c_skill in skill_pairs:
+            if c_skill == skill:
                 skills_matched.append(skill)
+            elif c_skill:
+                skills_matched.append(f"{skill} (~{c_skill})")
             else:
-                # Check for fuzzy match
-                fuzzy_matched = False
-                for c_skill in consultant_skills_lower:
-                    if SequenceMatcher(None, skill, c_skill).ratio() > 0.8:
-                        skills_matched.append(f"{skill} (~{c_skill})")
-                        fuzzy_matched = True
-                        break
-                if not fuzzy_matched:
-                    skills_missing.append(skill)
+                skills_missing.append(skill)
         
         # Language match
         language_match = scores['language'] >= 0.8
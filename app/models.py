@@ -1,5 +1,4 @@
 from datetime import date, datetime
-from decimal import Decimal
 from enum import Enum
 from typing import Optional, List, Dict, Any
 from uuid import UUID
@@ -137,16 +136,18 @@ class MatchReason(BaseModel):
     availability_match: bool
     strengths: List[str]
     concerns: List[str]
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class JobConsultantMatch(BaseModel):
     job_id: UUID
     consultant_id: UUID
-    score: Decimal
+    score: float
     reason_json: Dict[str, Any]
     created_at: datetime
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class MatchResult(BaseModel):
@@ -154,7 +155,7 @@ class MatchResult(BaseModel):
     consultant: Consultant
     match: JobConsultantMatch
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class MatchRequest(BaseModel):
@@ -215,8 +216,8 @@ class ScanningConfig(ScanningConfigIn):
     config_id: UUID
     total_matches_generated: int = 0
     successful_placements: int = 0
-    last_match_score: Optional[Decimal] = None
-    performance_score: Decimal = Decimal('0')
+    last_match_score: Optional[float] = None
+    performance_score: float = 0.0
     created_at: datetime
     updated_at: datetime
     
@@ -233,8 +234,8 @@ class SourceConfigOverride(SourceConfigOverrideIn):
     override_id: UUID
     config_id: UUID
     last_run_at: Optional[datetime] = None
-    success_rate: Decimal = Decimal('0')
-    avg_matches_per_run: Decimal = Decimal('0')
+    success_rate: float = 0.0
+    avg_matches_per_run: float = 0.0
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -245,9 +246,9 @@ class ConfigPerformanceLogIn(BaseModel):
     test_date: date
     jobs_found: int = 0
     matches_generated: int = 0
-    quality_score: Optional[Decimal] = None
-    consultant_interest_rate: Optional[Decimal] = None
-    placement_rate: Optional[Decimal] = None
+    quality_score: Optional[float] = None
+    consultant_interest_rate: Optional[float] = None
+    placement_rate: Optional[float] = None
     notes: Optional[str] = None
 
 
@@ -266,7 +267,7 @@ class LearningParameterIn(BaseModel):
 
 class LearningParameter(LearningParameterIn):
     param_id: UUID
-    effectiveness_score: Decimal = Decimal('0')
+    effectiveness_score: float = 0.0
     usage_count: int = 0
     last_used_at: Optional[datetime] = None
     created_at: datetime
@@ -3,13 +3,191 @@ Microsoft Teams notification service using webhook connectors.
 """
 
 import os
+import asyncio
 import logging
 import httpx
-from typing import Dict, Any, List, Optional
+import orjson
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Throttled (429) or briefly unavailable (503) webhook posts are retried in place
+MAX_SEND_ATTEMPTS = 3
+MAX_RETRY_DELAY_SECONDS = 30.0
+_RETRY_STATUSES = frozenset({429, 503})
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: Retry-After when given in seconds, else exponential."""
+    retry_after = response.headers.get("Retry-After")
+    try:
+        delay = float(retry_after) if retry_after else 2 ** (attempt - 1)
+    except ValueError:
+        # Retry-After can also be an HTTP date
+        delay = 2 ** (attempt - 1)
+    return min(delay, MAX_RETRY_DELAY_SECONDS)
+
+
+# Static Adaptive Card parts, built once and shared by every card. Cards are only
+# serialized, never mutated, so sharing the dicts is safe.
+_CARD_SCHEMA = "http://adaptivecards.io/schemas/adaptive-card.json"
+
+
+def _adaptive_card(body: List[Dict[str, Any]], actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Wrap an Adaptive Card body and actions in a Teams message."""
+    return {
+        "type": "message",
+        "attachments": [
+            {
+                "contentType": "application/vnd.microsoft.card.adaptive",
+                "contentUrl": None,
+                "content": {
+                    "$schema": _CARD_SCHEMA,
+                    "type": "AdaptiveCard",
+                    "version": "1.2",
+                    "body": body,
+                    "actions": actions
+                }
+            }
+        ]
+    }
+
+
+def _section_title(text: str) -> Dict[str, Any]:
+    return {
+        "type": "TextBlock",
+        "text": text,
+        "size": "Medium",
+        "weight": "Bolder"
+    }
+
+
+def _metric_column(label: str, value: Any, color: str) -> Dict[str, Any]:
+    return {
+        "type": "Column",
+        "width": "stretch",
+        "items": [
+            {
+                "type": "TextBlock",
+                "text": label,
+                "isSubtle": True
+            },
+            {
+                "type": "TextBlock",
+                "text": str(value),
+                "size": "Large",
+                "weight": "Bolder",
+                "color": color
+            }
+        ]
+    }
+
+
+_DAILY_ICON_COLUMN = {
+    "type": "Column",
+    "width": "auto",
+    "items": [
+        {
+            "type": "Image",
+            "url": "https://img.icons8.com/fluency/48/000000/analytics.png",
+            "size": "Medium"
+        }
+    ]
+}
+
+_DAILY_TITLE = {
+    "type": "TextBlock",
+    "text": "Daily Scanning Report",
+    "weight": "Bolder",
+    "size": "Large"
+}
+
+_KEY_METRICS_TITLE = _section_title("📊 **Key Metrics**")
+_TOP_CONSULTANTS_TITLE = _section_title("🏆 **Top Matched Consultants**")
+_SOURCES_TITLE = _section_title("📍 **Sources Breakdown**")
+
+# (title, URL env var, default URL); the URL is read per card so later env changes apply
+_DAILY_ACTIONS = ("View Full Report", "REPORT_URL", "https://example.com/reports")
+
+_WEEKLY_TITLE = {
+    "type": "TextBlock",
+    "text": "📈 Weekly Market Analysis",
+    "weight": "Bolder",
+    "size": "Large"
+}
+
+_WEEKLY_SUMMARY_TITLE = _section_title("**Weekly Summary**")
+_SKILLS_TITLE = _section_title("**🔥 Most In-Demand Skills**")
+
+_KEY_INSIGHT_TITLE = {
+    "type": "TextBlock",
+    "text": "💡 **Key Insight**",
+    "weight": "Bolder"
+}
+
+_WEEKLY_ACTIONS = ("View Detailed Analysis", "REPORT_URL", "https://example.com/reports/weekly")
+
+_MONDAY_ICON_COLUMN = {
+    "type": "Column",
+    "width": "auto",
+    "items": [
+        {
+            "type": "TextBlock",
+            "text": "☕",
+            "size": "ExtraLarge"
+        }
+    ]
+}
+
+_MONDAY_TITLE = {
+    "type": "TextBlock",
+    "text": "Monday Morning Brief",
+    "weight": "Bolder",
+    "size": "Large"
+}
+
+_URGENT_TITLE = {
+    "type": "TextBlock",
+    "text": "⚡ **Urgent Matches Requiring Action**",
+    "weight": "Bolder",
+    "size": "Medium"
+}
+
+_PRIORITIES_TITLE = {
+    "type": "TextBlock",
+    "text": "📋 **This Week's Priorities**",
+    "weight": "Bolder",
+    "size": "Medium"
+}
+
+_MONDAY_FOOTER = {
+    "type": "Container",
+    "style": "good",
+    "items": [
+        {
+            "type": "TextBlock",
+            "text": "Have a productive week! 🚀",
+            "horizontalAlignment": "Center",
+            "weight": "Lighter"
+        }
+    ]
+}
+
+_MONDAY_ACTIONS = ("Open Dashboard", "DASHBOARD_URL", "https://example.com/dashboard")
+
+
+def _open_url_actions(action: Tuple[str, str, str]) -> List[Dict[str, Any]]:
+    """Build a card's OpenUrl action, reading its URL from the environment now."""
+    title, url_env, default_url = action
+    return [
+        {
+            "type": "Action.OpenUrl",
+            "title": title,
+            "url": os.getenv(url_env, default_url)
+        }
+    ]
+
 
 class TeamsNotificationService:
     """
@@ -21,6 +199,8 @@ class TeamsNotificationService:
         # Teams webhook URL from environment
         self.webhook_url = os.getenv("TEAMS_WEBHOOK_URL", "")
         self.timeout = int(os.getenv("TEAMS_TIMEOUT", "30"))
+        # Created on first send and reused, so the webhook's TLS session is kept alive
+        self._client: Optional[httpx.AsyncClient] = None
         
     def is_configured(self) -> bool:
         """Check if Teams service is properly configured."""
@@ -71,25 +251,56 @@ class TeamsNotificationService:
             logger.error(f"Failed to send Monday Teams brief: {e}")
             return False
     
+    async def send_all(
+        self,
+        *,
+        daily: Optional[Dict[str, Any]] = None,
+        weekly: Optional[Dict[str, Any]] = None,
+        monday: Optional[Dict[str, Any]] = None
+    ) -> List[bool]:
+        """
+        Send the given reports concurrently over the shared client.
+        Returns one result per report given, in daily/weekly/monday order.
+        """
+        sends = []
+        if daily is not None:
+            sends.append(self.send_daily_report(daily))
+        if weekly is not None:
+            sends.append(self.send_weekly_report(weekly))
+        if monday is not None:
+            sends.append(self.send_monday_brief(monday))
+        # Each send logs and returns False on failure, so one can't cancel the others
+        return list(await asyncio.gather(*sends))
+    
     async def send_card(self, card: Dict[str, Any]) -> bool:
         """
         Send an Adaptive Card to Teams webhook.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.webhook_url,
-                    json=card,
-                    headers={"Content-Type": "application/json"}
-                )
+            # Serialized once; retries resend the same body on the same client
+            body = orjson.dumps(card)
+            client = self._get_client()
+            
+            for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+                response = await client.post(self.webhook_url, content=body)
                 
                 if response.status_code == 200:
-                    logger.info("Teams notification sent successfully")
+                    logger.info(f"Teams notification sent successfully (attempt {attempt})")
                     return True
-                else:
-                    logger.error(f"Teams webhook returned {response.status_code}: {response.text}")
+                
+                if response.status_code not in _RETRY_STATUSES or attempt == MAX_SEND_ATTEMPTS:
+                    logger.error(
+                        f"Teams webhook returned {response.status_code} after {attempt} attempt(s): {response.text}"
+                    )
                     return False
-                    
+                
+                delay = _retry_delay(response, attempt)
+                logger.warning(
+                    f"Teams webhook returned {response.status_code}, retrying in {delay:.1f}s "
+                    f"(attempt {attempt}/{MAX_SEND_ATTEMPTS})"
+                )
+                await asyncio.sleep(delay)
+                
         except httpx.TimeoutException:
             logger.error("Teams webhook request timed out")
             return False
@@ -97,6 +308,22 @@ class TeamsNotificationService:
             logger.error(f"Failed to send Teams notification: {e}")
             return False
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared webhook client, creating it if needed."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=4, max_connections=10),
+                headers={"Content-Type": "application/json"}
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared webhook client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _create_daily_report_card(self, report: Dict[str, Any]) -> Dict[str, Any]:
         """Create an Adaptive Card for daily report."""
         new_jobs = report.get('new_jobs', 0)
@@ -111,175 +338,74 @@ class TeamsNotificationService:
             for source, count in sources.items()
         ]
         
-        card = {
-            "type": "message",
-            "attachments": [
+        top_items = [_TOP_CONSULTANTS_TITLE]
+        top_items.extend(
+            {
+                "type": "TextBlock",
+                "text": f"• {c.get('name', 'N/A')} - {c.get('match_count', 0)} matches ({c.get('avg_score', 0):.0%} avg)",
+                "wrap": True
+            }
+            for c in top_consultants
+        )
+        
+        return _adaptive_card(
+            [
                 {
-                    "contentType": "application/vnd.microsoft.card.adaptive",
-                    "contentUrl": None,
-                    "content": {
-                        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-                        "type": "AdaptiveCard",
-                        "version": "1.2",
-                        "body": [
-                            {
-                                "type": "Container",
-                                "style": "emphasis",
-                                "items": [
-                                    {
-                                        "type": "ColumnSet",
-                                        "columns": [
-                                            {
-                                                "type": "Column",
-                                                "width": "auto",
-                                                "items": [
-                                                    {
-                                                        "type": "Image",
-                                                        "url": "https://img.icons8.com/fluency/48/000000/analytics.png",
-                                                        "size": "Medium"
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                "type": "Column",
-                                                "width": "stretch",
-                                                "items": [
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": "Daily Scanning Report",
-                                                        "weight": "Bolder",
-                                                        "size": "Large"
-                                                    },
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": datetime.now().strftime('%A, %B %d, %Y'),
-                                                        "isSubtle": True,
-                                                        "spacing": "None"
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    }
-                                ]
-                            },
-                            {
-                                "type": "Container",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "📊 **Key Metrics**",
-                                        "size": "Medium",
-                                        "weight": "Bolder"
-                                    },
-                                    {
-                                        "type": "ColumnSet",
-                                        "columns": [
-                                            {
-                                                "type": "Column",
-                                                "width": "stretch",
-                                                "items": [
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": "New Jobs",
-                                                        "isSubtle": True
-                                                    },
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": str(new_jobs),
-                                                        "size": "Large",
-                                                        "weight": "Bolder",
-                                                        "color": "Accent"
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                "type": "Column",
-                                                "width": "stretch",
-                                                "items": [
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": "Total Matches",
-                                                        "isSubtle": True
-                                                    },
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": str(total_matches),
-                                                        "size": "Large",
-                                                        "weight": "Bolder",
-                                                        "color": "Good"
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                "type": "Column",
-                                                "width": "stretch",
-                                                "items": [
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": "High Quality",
-                                                        "isSubtle": True
-                                                    },
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": str(high_quality_matches),
-                                                        "size": "Large",
-                                                        "weight": "Bolder",
-                                                        "color": "Good"
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    }
-                                ]
-                            },
-                            {
-                                "type": "Container",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "🏆 **Top Matched Consultants**",
-                                        "size": "Medium",
-                                        "weight": "Bolder"
-                                    },
-                                    *[
+                    "type": "Container",
+                    "style": "emphasis",
+                    "items": [
+                        {
+                            "type": "ColumnSet",
+                            "columns": [
+                                _DAILY_ICON_COLUMN,
+                                {
+                                    "type": "Column",
+                                    "width": "stretch",
+                                    "items": [
+                                        _DAILY_TITLE,
                                         {
                                             "type": "TextBlock",
-                                            "text": f"• {c.get('name', 'N/A')} - {c.get('match_count', 0)} matches ({c.get('avg_score', 0):.0%} avg)",
-                                            "wrap": True
+                                            "text": datetime.now().strftime('%A, %B %d, %Y'),
+                                            "isSubtle": True,
+                                            "spacing": "None"
                                         }
-                                        for c in top_consultants
                                     ]
-                                ]
-                            },
-                            {
-                                "type": "Container",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "📍 **Sources Breakdown**",
-                                        "size": "Medium",
-                                        "weight": "Bolder"
-                                    },
-                                    {
-                                        "type": "FactSet",
-                                        "facts": source_facts
-                                    }
-                                ]
-                            }
-                        ],
-                        "actions": [
-                            {
-                                "type": "Action.OpenUrl",
-                                "title": "View Full Report",
-                                "url": os.getenv("REPORT_URL", "https://example.com/reports")
-                            }
-                        ]
-                    }
+                                }
+                            ]
+                        }
+                    ]
+                },
+                {
+                    "type": "Container",
+                    "items": [
+                        _KEY_METRICS_TITLE,
+                        {
+                            "type": "ColumnSet",
+                            "columns": [
+                                _metric_column("New Jobs", new_jobs, "Accent"),
+                                _metric_column("Total Matches", total_matches, "Good"),
+                                _metric_column("High Quality", high_quality_matches, "Good")
+                            ]
+                        }
+                    ]
+                },
+                {
+                    "type": "Container",
+                    "items": top_items
+                },
+                {
+                    "type": "Container",
+                    "items": [
+                        _SOURCES_TITLE,
+                        {
+                            "type": "FactSet",
+                            "facts": source_facts
+                        }
+                    ]
                 }
-            ]
-        }
-        
-        return card
+            ],
+            _open_url_actions(_DAILY_ACTIONS)
+        )
     
     def _create_weekly_report_card(self, report: Dict[str, Any]) -> Dict[str, Any]:
         """Create an Adaptive Card for weekly report."""
@@ -292,128 +418,90 @@ class TeamsNotificationService:
         trend_color = "Good" if week_over_week > 0 else "Attention"
         trend_icon = "📈" if week_over_week > 0 else "📉"
         
-        card = {
-            "type": "message",
-            "attachments": [
+        # Skill names and counts are shown side by side, built in one pass
+        skill_names = []
+        skill_counts = []
+        for i, skill in enumerate(top_skills, 1):
+            skill_names.append(f"{i}. {skill.get('skill', 'N/A')}")
+            skill_counts.append(f"({skill.get('count', 0)})")
+        
+        return _adaptive_card(
+            [
                 {
-                    "contentType": "application/vnd.microsoft.card.adaptive",
-                    "contentUrl": None,
-                    "content": {
-                        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-                        "type": "AdaptiveCard",
-                        "version": "1.2",
-                        "body": [
-                            {
-                                "type": "Container",
-                                "style": "good",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "📈 Weekly Market Analysis",
-                                        "weight": "Bolder",
-                                        "size": "Large"
-                                    },
-                                    {
-                                        "type": "TextBlock",
-                                        "text": f"Week {datetime.now().strftime('%V, %Y')}",
-                                        "isSubtle": True
-                                    }
-                                ]
-                            },
-                            {
-                                "type": "Container",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "**Weekly Summary**",
-                                        "size": "Medium",
-                                        "weight": "Bolder"
-                                    },
-                                    {
-                                        "type": "FactSet",
-                                        "facts": [
-                                            {"title": "Total Assignments", "value": str(total_jobs)},
-                                            {"title": "Week-over-Week", "value": f"{trend_icon} {week_over_week:+.1%}"},
-                                            {"title": "Placement Rate", "value": f"{placement_rate:.1%}"}
-                                        ]
-                                    }
-                                ]
-                            },
-                            {
-                                "type": "Container",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "**🔥 Most In-Demand Skills**",
-                                        "size": "Medium",
-                                        "weight": "Bolder"
-                                    },
-                                    {
-                                        "type": "ColumnSet",
-                                        "columns": [
-                                            {
-                                                "type": "Column",
-                                                "width": "stretch",
-                                                "items": [
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": "\n".join([
-                                                            f"{i+1}. {skill.get('skill', 'N/A')}"
-                                                            for i, skill in enumerate(top_skills)
-                                                        ]),
-                                                        "wrap": True
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                "type": "Column",
-                                                "width": "auto",
-                                                "items": [
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": "\n".join([
-                                                            f"({skill.get('count', 0)})"
-                                                            for skill in top_skills
-                                                        ]),
-                                                        "isSubtle": True
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    }
-                                ]
-                            },
-                            {
-                                "type": "Container",
-                                "style": "accent",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "💡 **Key Insight**",
-                                        "weight": "Bolder"
-                                    },
-                                    {
-                                        "type": "TextBlock",
-                                        "text": f"The market shows {'increased' if week_over_week > 0 else 'decreased'} demand this week. "
-                                                f"Focus on consultants with {top_skills[0]['skill'] if top_skills else 'trending'} expertise.",
-                                        "wrap": True
-                                    }
-                                ]
-                            }
-                        ],
-                        "actions": [
-                            {
-                                "type": "Action.OpenUrl",
-                                "title": "View Detailed Analysis",
-                                "url": os.getenv("REPORT_URL", "https://example.com/reports/weekly")
-                            }
-                        ]
-                    }
+                    "type": "Container",
+                    "style": "good",
+                    "items": [
+                        _WEEKLY_TITLE,
+                        {
+                            "type": "TextBlock",
+                            "text": f"Week {datetime.now().strftime('%V, %Y')}",
+                            "isSubtle": True
+                        }
+                    ]
+                },
+                {
+                    "type": "Container",
+                    "items": [
+                        _WEEKLY_SUMMARY_TITLE,
+                        {
+                            "type": "FactSet",
+                            "facts": [
+                                {"title": "Total Assignments", "value": str(total_jobs)},
+                                {"title": "Week-over-Week", "value": f"{trend_icon} {week_over_week:+.1%}"},
+                                {"title": "Placement Rate", "value": f"{placement_rate:.1%}"}
+                            ]
+                        }
+                    ]
+                },
+                {
+                    "type": "Container",
+                    "items": [
+                        _SKILLS_TITLE,
+                        {
+                            "type": "ColumnSet",
+                            "columns": [
+                                {
+                                    "type": "Column",
+                                    "width": "stretch",
+                                    "items": [
+                                        {
+                                            "type": "TextBlock",
+                                            "text": "\n".join(skill_names),
+                                            "wrap": True
+                                        }
+                                    ]
+                                },
+                                {
+                                    "type": "Column",
+                                    "width": "auto",
+                                    "items": [
+                                        {
+                                            "type": "TextBlock",
+                                            "text": "\n".join(skill_counts),
+                                            "isSubtle": True
+                                        }
+                                    ]
+                                }
+                            ]
+                        }
+                    ]
+                },
+                {
+                    "type": "Container",
+                    "style": "accent",
+                    "items": [
+                        _KEY_INSIGHT_TITLE,
+                        {
+                            "type": "TextBlock",
+                            "text": f"The market shows {'increased' if week_over_week > 0 else 'decreased'} demand this week. "
+                                    f"Focus on consultants with {top_skills[0]['skill'] if top_skills else 'trending'} expertise.",
+                            "wrap": True
+                        }
+                    ]
                 }
-            ]
-        }
-        
-        return card
+            ],
+            _open_url_actions(_WEEKLY_ACTIONS)
+        )
     
     def _create_monday_brief_card(self, brief: Dict[str, Any]) -> Dict[str, Any]:
         """Create an Adaptive Card for Monday morning brief."""
@@ -423,6 +511,8 @@ class TeamsNotificationService:
         
         # Build urgent matches section
         urgent_items = []
+        if urgent_matches:
+            urgent_items.append(_URGENT_TITLE)
         for match in urgent_matches:
             urgent_items.append({
                 "type": "Container",
@@ -443,121 +533,62 @@ class TeamsNotificationService:
                 ]
             })
         
-        card = {
-            "type": "message",
-            "attachments": [
+        priority_items = [_PRIORITIES_TITLE]
+        priority_items.extend(
+            {
+                "type": "TextBlock",
+                "text": f"✓ {priority}",
+                "wrap": True
+            }
+            for priority in week_priorities
+        )
+        
+        return _adaptive_card(
+            [
                 {
-                    "contentType": "application/vnd.microsoft.card.adaptive",
-                    "contentUrl": None,
-                    "content": {
-                        "$schema": "http://adaptivecards.io/schemas/adaptive-card.json",
-                        "type": "AdaptiveCard",
-                        "version": "1.2",
-                        "body": [
-                            {
-                                "type": "Container",
-                                "style": "accent",
-                                "items": [
-                                    {
-                                        "type": "ColumnSet",
-                                        "columns": [
-                                            {
-                                                "type": "Column",
-                                                "width": "auto",
-                                                "items": [
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": "☕",
-                                                        "size": "ExtraLarge"
-                                                    }
-                                                ]
-                                            },
-                                            {
-                                                "type": "Column",
-                                                "width": "stretch",
-                                                "items": [
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": "Monday Morning Brief",
-                                                        "weight": "Bolder",
-                                                        "size": "Large"
-                                                    },
-                                                    {
-                                                        "type": "TextBlock",
-                                                        "text": datetime.now().strftime('%B %d, %Y'),
-                                                        "isSubtle": True,
-                                                        "spacing": "None"
-                                                    }
-                                                ]
-                                            }
-                                        ]
-                                    }
-                                ]
-                            },
-                            {
-                                "type": "Container",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": f"**Weekend Activity**: {weekend_jobs} new assignments posted",
-                                        "wrap": True
-                                    }
-                                ]
-                            },
-                            {
-                                "type": "Container",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "⚡ **Urgent Matches Requiring Action**",
-                                        "weight": "Bolder",
-                                        "size": "Medium"
-                                    },
-                                    *urgent_items
-                                ] if urgent_matches else []
-                            },
-                            {
-                                "type": "Container",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "📋 **This Week's Priorities**",
-                                        "weight": "Bolder",
-                                        "size": "Medium"
-                                    },
-                                    *[
+                    "type": "Container",
+                    "style": "accent",
+                    "items": [
+                        {
+                            "type": "ColumnSet",
+                            "columns": [
+                                _MONDAY_ICON_COLUMN,
+                                {
+                                    "type": "Column",
+                                    "width": "stretch",
+                                    "items": [
+                                        _MONDAY_TITLE,
                                         {
                                             "type": "TextBlock",
-                                            "text": f"✓ {priority}",
-                                            "wrap": True
+                                            "text": datetime.now().strftime('%B %d, %Y'),
+                                            "isSubtle": True,
+                                            "spacing": "None"
                                         }
-                                        for priority in week_priorities
                                     ]
-                                ]
-                            },
-                            {
-                                "type": "Container",
-                                "style": "good",
-                                "items": [
-                                    {
-                                        "type": "TextBlock",
-                                        "text": "Have a productive week! 🚀",
-                                        "horizontalAlignment": "Center",
-                                        "weight": "Lighter"
-                                    }
-                                ]
-                            }
-                        ],
-                        "actions": [
-                            {
-                                "type": "Action.OpenUrl",
-                                "title": "Open Dashboard",
-                                "url": os.getenv("DASHBOARD_URL", "https://example.com/dashboard")
-                            }
-                        ]
-                    }
-                }
-            ]
-        }
-        
-        return card
\ No newline at end of file
+                                }
+                            ]
+                        }
+                    ]
+                },
+                {
+                    "type": "Container",
+                    "items": [
+                        {
+                            "type": "TextBlock",
+                            "text": f"**Weekend Activity**: {weekend_jobs} new assignments posted",
+                            "wrap": True
+                        }
+                    ]
+                },
+                {
+                    "type": "Container",
+                    "items": urgent_items
+                },
+                {
+                    "type": "Container",
+                    "items": priority_items
+                },
+                _MONDAY_FOOTER
+            ],
+            _open_url_actions(_MONDAY_ACTIONS)
+        )
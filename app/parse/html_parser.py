@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any
-from selectolax.parser import HTMLParser
+from selectolax.lexbor import LexborHTMLParser
 import re
 from datetime import datetime, date
 import logging
@@ -8,6 +8,24 @@ from app.models import JobIn
 
 logger = logging.getLogger(__name__)
 
+# Common technical skills, compiled once with their flags so parsing never goes
+# through re's pattern cache
+_SKILL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\b(?:Python|Java|JavaScript|TypeScript|C#|C\+\+|Go|Rust|Kotlin|Swift|Ruby|PHP|Scala)\b',
+    r'\b(?:React|Angular|Vue|Django|Flask|FastAPI|Spring|Node\.js|\.NET|Rails|Laravel)\b',
+    r'\b(?:PostgreSQL|MySQL|MongoDB|Redis|Elasticsearch|SQL|NoSQL|Oracle)\b',
+    r'\b(?:AWS|Azure|GCP|Docker|Kubernetes|Jenkins|CI/CD|Terraform|Ansible)\b',
+    r'\b(?:Machine Learning|AI|Data Science|TensorFlow|PyTorch|Pandas|NumPy)\b',
+    r'\b(?:REST|GraphQL|Microservices|Agile|Scrum|Git|DevOps|Cloud)\b'
+))
+
+# Date patterns
+_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d{4}-\d{2}-\d{2})',
+    r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
+    r'(\d{1,2}\s+\w+\s+\d{4})'
+))
+
 
 class GenericHTMLParser:
     """Generic HTML parser for job listings."""
@@ -17,7 +35,7 @@ class GenericHTMLParser:
     
     def parse_job_listing(self, html: str, url: str = None) -> List[JobIn]:
         """Parse HTML content to extract job listings."""
-        parser = HTMLParser(html)
+        parser = LexborHTMLParser(html)
         jobs = []
         
         # Try different common job listing selectors
@@ -103,7 +121,7 @@ class GenericHTMLParser:
             logger.error(f"Error parsing job element: {e}")
             return None
     
-    def _parse_single_job(self, parser: HTMLParser, url: str = None) -> Optional[JobIn]:
+    def _parse_single_job(self, parser: LexborHTMLParser, url: str = None) -> Optional[JobIn]:
         """Parse a single job page."""
         try:
             # Extract from common meta tags or structured data
@@ -267,19 +285,9 @@ class GenericHTMLParser:
         if not text:
             return []
         
-        # Common technical skills
-        skill_patterns = [
-            r'\b(?:Python|Java|JavaScript|TypeScript|C#|C\+\+|Go|Rust|Kotlin|Swift|Ruby|PHP|Scala)\b',
-            r'\b(?:React|Angular|Vue|Django|Flask|FastAPI|Spring|Node\.js|\.NET|Rails|Laravel)\b',
-            r'\b(?:PostgreSQL|MySQL|MongoDB|Redis|Elasticsearch|SQL|NoSQL|Oracle)\b',
-            r'\b(?:AWS|Azure|GCP|Docker|Kubernetes|Jenkins|CI/CD|Terraform|Ansible)\b',
-            r'\b(?:Machine Learning|AI|Data Science|TensorFlow|PyTorch|Pandas|NumPy)\b',
-            r'\b(?:REST|GraphQL|Microservices|Agile|Scrum|Git|DevOps|Cloud)\b'
-        ]
-        
         skills = []
-        for pattern in skill_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in _SKILL_PATTERNS:
+            matches = pattern.findall(text)
             skills.extend(matches)
         
         return list(set(skills))
@@ -288,16 +296,9 @@ class GenericHTMLParser:
         """Extract start and end dates."""
         date_text = element.text()
         
-        # Look for date patterns
-        date_patterns = [
-            r'(\d{4}-\d{2}-\d{2})',
-            r'(\d{1,2}[/-]\d{1,2}[/-]\d{4})',
-            r'(\d{1,2}\s+\w+\s+\d{4})'
-        ]
-        
         dates = []
-        for pattern in date_patterns:
-            matches = re.findall(pattern, date_text)
+        for pattern in _DATE_PATTERNS:
+            matches = pattern.findall(date_text)
             for match in matches:
                 try:
                     # Try to parse date
@@ -313,21 +314,21 @@ class GenericHTMLParser:
         
         return None, None
     
-    def _extract_text(self, parser: HTMLParser, selector: str) -> Optional[str]:
+    def _extract_text(self, parser: LexborHTMLParser, selector: str) -> Optional[str]:
         """Extract text from parser using selector."""
         elem = parser.css_first(selector)
         if elem:
             return elem.text(strip=True)
         return None
     
-    def _extract_meta_property(self, parser: HTMLParser, property: str) -> Optional[str]:
+    def _extract_meta_property(self, parser: LexborHTMLParser, property: str) -> Optional[str]:
         """Extract meta property content."""
         meta = parser.css_first(f'meta[property="{property}"]')
         if meta:
             return meta.attributes.get('content')
         return None
     
-    def _extract_structured_data(self, parser: HTMLParser) -> Optional[Dict[str, Any]]:
+    def _extract_structured_data(self, parser: LexborHTMLParser) -> Optional[Dict[str, Any]]:
         """Extract JSON-LD structured data."""
         script = parser.css_first('script[type="application/ld+json"]')
         if script:
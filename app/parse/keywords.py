@@ -0,0 +1,33 @@
+"""
+Compiled keyword matchers shared by the scanner UI and scrapers.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Pattern, Tuple
+
+
+@lru_cache(maxsize=64)
+def compile_keyword_matcher(keywords: Tuple[str, ...]) -> Pattern[str]:
+    """
+    Compile a case-insensitive alternation matching any of the given keywords as whole words.
+
+    Results are memoized on the keyword tuple, so callers can request the matcher per
+    document without recompiling. Changing scanning criteria produces a new tuple and
+    therefore a new pattern; stale ones fall out of the LRU.
+    """
+    terms = sorted({k.strip() for k in keywords if k and k.strip()}, key=len, reverse=True)
+    if not terms:
+        # Never matches
+        return re.compile(r'(?!)')
+    # Lookarounds instead of \b so keywords ending in symbols (C#, C++, .NET) still anchor
+    alternation = '|'.join(re.escape(term) for term in terms)
+    return re.compile(rf'(?<!\w)(?:{alternation})(?!\w)', re.IGNORECASE)
+
+
+def keyword_matcher_for(*keyword_lists: Iterable[str]) -> Pattern[str]:
+    """Build the cache key from one or more keyword lists and return the compiled matcher."""
+    keywords = []
+    for values in keyword_lists:
+        keywords.extend(values or [])
+    return compile_keyword_matcher(tuple(keywords))
@@ -1,19 +1,32 @@
 import asyncpg
-from typing import List, Optional, Dict, Any
+from pgvector.asyncpg import register_vector
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime, date
 import json
-from decimal import Decimal
+import math
+import orjson
 from copy import deepcopy
 
 from app.models import (
     Job, JobIn, Consultant, ConsultantIn,
     Company, CompanyIn, Broker, BrokerIn,
-    JobConsultantMatch, IngestionLog,
+    JobConsultantMatch, IngestionLog, OnsiteMode,
     SkillAlias, RoleAlias
 )
 
 
+def _embedding_to_list(value: Any) -> Optional[List[float]]:
+    """Convert a decoded vector/halfvec column (numpy array or HalfVector) to a list."""
+    if value is None:
+        return None
+    if hasattr(value, 'to_list'):
+        return value.to_list()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return list(value)
+
+
 DEFAULT_EXECUTIVE_ROLES = [
     "Interim CTO",
     "Interim CIO",
@@ -101,13 +114,23 @@ DEFAULT_SOURCE_OVERRIDES = {
 }
 
 
+# JobIn fields written by upsert_jobs; extra attributes set by scrapers are left out
+_JOB_UPSERT_FIELDS = {
+    'job_uid', 'source', 'title', 'description', 'skills', 'role', 'seniority',
+    'languages', 'location_city', 'location_country', 'onsite_mode', 'duration',
+    'start_date', 'company_id', 'broker_id', 'url', 'posted_at', 'scraped_etag',
+    'scraped_last_modified', 'raw_json'
+}
+
+
 class DatabaseRepository:
     def __init__(self, db_url: str):
         self.db_url = db_url
         self.pool = None
     
     async def init(self):
-        self.pool = await asyncpg.create_pool(self.db_url)
+        # Binary codecs for vector/halfvec, so embeddings bind as lists instead of text
+        self.pool = await asyncpg.create_pool(self.db_url, init=register_vector)
     
     async def close(self):
         if self.pool:
@@ -128,11 +151,7 @@ class DatabaseRepository:
                 company.normalized_name,
                 company.aliases if company.aliases else []
             )
-            return Company(
-                company_id=row['company_id'],
-                normalized_name=row['normalized_name'],
-                aliases=list(row['aliases']) if row['aliases'] else []
-            )
+            return self._row_to_company(row)
     
     async def get_company_by_name(self, name: str) -> Optional[Company]:
         async with self.pool.acquire() as conn:
@@ -143,11 +162,7 @@ class DatabaseRepository:
             """
             row = await conn.fetchrow(query, name)
             if row:
-                return Company(
-                    company_id=row['company_id'],
-                    normalized_name=row['normalized_name'],
-                    aliases=list(row['aliases']) if row['aliases'] else []
-                )
+                return self._row_to_company(row)
             return None
     
     # Broker operations
@@ -165,22 +180,14 @@ class DatabaseRepository:
                 broker.name,
                 broker.portal_url
             )
-            return Broker(
-                broker_id=row['broker_id'],
-                name=row['name'],
-                portal_url=row['portal_url']
-            )
+            return self._row_to_broker(row)
     
     async def get_broker_by_name(self, name: str) -> Optional[Broker]:
         async with self.pool.acquire() as conn:
             query = "SELECT * FROM brokers WHERE name = $1"
             row = await conn.fetchrow(query, name)
             if row:
-                return Broker(
-                    broker_id=row['broker_id'],
-                    name=row['name'],
-                    portal_url=row['portal_url']
-                )
+                return self._row_to_broker(row)
             return None
     
     # Job operations
@@ -244,7 +251,7 @@ class DatabaseRepository:
                 job.posted_at,
                 job.scraped_etag,
                 job.scraped_last_modified,
-                json.dumps(job.raw_json) if job.raw_json else None
+                orjson.dumps(job.raw_json, option=orjson.OPT_NON_STR_KEYS).decode() if job.raw_json else None
             )
             
             return self._row_to_job(row)
@@ -255,6 +262,16 @@ class DatabaseRepository:
             row = await conn.fetchrow(query, job_id)
             return self._row_to_job(row) if row else None
     
+    async def get_jobs_by_ids(self, job_ids: List[UUID]) -> List[Job]:
+        """Fetch several jobs in one query; missing ids are skipped."""
+        if not job_ids:
+            return []
+        
+        async with self.pool.acquire() as conn:
+            query = "SELECT * FROM jobs WHERE job_id = ANY($1::uuid[])"
+            rows = await conn.fetch(query, job_ids)
+            return [self._row_to_job(row) for row in rows]
+    
     async def get_jobs(
         self,
         source: Optional[str] = None,
@@ -366,6 +383,16 @@ class DatabaseRepository:
             row = await conn.fetchrow(query, consultant_id)
             return self._row_to_consultant(row) if row else None
     
+    async def get_consultants_by_ids(self, consultant_ids: List[UUID]) -> List[Consultant]:
+        """Fetch several consultants in one query; missing ids are skipped."""
+        if not consultant_ids:
+            return []
+        
+        async with self.pool.acquire() as conn:
+            query = "SELECT * FROM consultants WHERE consultant_id = ANY($1::uuid[])"
+            rows = await conn.fetch(query, consultant_ids)
+            return [self._row_to_consultant(row) for row in rows]
+    
     async def get_consultants(
         self,
         active_only: bool = True,
@@ -487,6 +514,25 @@ class DatabaseRepository:
             """
             await conn.execute(query, job_id, embedding)
     
+    async def store_job_embeddings(
+        self,
+        embeddings: List[Tuple[UUID, List[float]]]
+    ):
+        """Store several job embeddings in one round trip."""
+        if not embeddings:
+            return
+        
+        async with self.pool.acquire() as conn:
+            query = """
+                INSERT INTO job_embeddings (job_id, embedding)
+                VALUES ($1, $2)
+                ON CONFLICT (job_id)
+                DO UPDATE SET
+                    embedding = EXCLUDED.embedding,
+                    updated_at = now()
+            """
+            await conn.executemany(query, embeddings)
+    
     async def store_consultant_embedding(
         self,
         consultant_id: UUID,
@@ -503,17 +549,130 @@ class DatabaseRepository:
             """
             await conn.execute(query, consultant_id, embedding)
     
+    async def store_consultant_embeddings(
+        self,
+        embeddings: List[Tuple[UUID, List[float]]]
+    ):
+        """Store several consultant embeddings in one round trip."""
+        if not embeddings:
+            return
+        
+        async with self.pool.acquire() as conn:
+            query = """
+                INSERT INTO consultant_embeddings (consultant_id, embedding)
+                VALUES ($1, $2)
+                ON CONFLICT (consultant_id)
+                DO UPDATE SET
+                    embedding = EXCLUDED.embedding,
+                    updated_at = now()
+            """
+            await conn.executemany(query, embeddings)
+    
+    async def get_embedded_job_ids(self, job_ids: List[UUID]) -> set:
+        """Return the subset of job_ids that already have an embedding."""
+        if not job_ids:
+            return set()
+        
+        async with self.pool.acquire() as conn:
+            query = """
+                SELECT job_id FROM job_embeddings
+                WHERE job_id = ANY($1::uuid[]) AND embedding IS NOT NULL
+            """
+            rows = await conn.fetch(query, job_ids)
+            return {row['job_id'] for row in rows}
+    
+    async def get_embedded_consultant_ids(self, consultant_ids: List[UUID]) -> set:
+        """Return the subset of consultant_ids that already have an embedding."""
+        if not consultant_ids:
+            return set()
+        
+        async with self.pool.acquire() as conn:
+            query = """
+                SELECT consultant_id FROM consultant_embeddings
+                WHERE consultant_id = ANY($1::uuid[]) AND embedding IS NOT NULL
+            """
+            rows = await conn.fetch(query, consultant_ids)
+            return {row['consultant_id'] for row in rows}
+    
     async def get_job_embedding(self, job_id: UUID) -> Optional[List[float]]:
         async with self.pool.acquire() as conn:
             query = "SELECT embedding FROM job_embeddings WHERE job_id = $1"
             row = await conn.fetchrow(query, job_id)
-            return list(row['embedding']) if row and row['embedding'] else None
+            return _embedding_to_list(row['embedding']) if row else None
     
     async def get_consultant_embedding(self, consultant_id: UUID) -> Optional[List[float]]:
         async with self.pool.acquire() as conn:
             query = "SELECT embedding FROM consultant_embeddings WHERE consultant_id = $1"
             row = await conn.fetchrow(query, consultant_id)
-            return list(row['embedding']) if row and row['embedding'] else None
+            return _embedding_to_list(row['embedding']) if row else None
+    
+    async def get_embedding_similarities(
+        self,
+        job_id: UUID,
+        consultant_ids: List[UUID]
+    ) -> Dict[UUID, float]:
+        """Cosine similarity between a job's embedding and each consultant's, computed by pgvector.
+        
+        Consultants without an embedding are absent from the result.
+        """
+        if not consultant_ids:
+            return {}
+        
+        async with self.pool.acquire() as conn:
+            query = """
+                SELECT ce.consultant_id, 1 - (ce.embedding <=> je.embedding) AS similarity
+                FROM job_embeddings je
+                JOIN consultant_embeddings ce ON ce.consultant_id = ANY($2::uuid[])
+                WHERE je.job_id = $1
+                  AND je.embedding IS NOT NULL
+                  AND ce.embedding IS NOT NULL
+            """
+            rows = await conn.fetch(query, job_id, consultant_ids)
+            # Zero vectors give NaN distance; score them like the old numpy path did
+            return {
+                row['consultant_id']: 0.0 if math.isnan(row['similarity']) else float(row['similarity'])
+                for row in rows
+            }
+    
+    # Embedding cache operations
+    async def get_cached_embeddings(
+        self,
+        text_hashes: List[bytes],
+        model_version: str
+    ) -> Dict[bytes, List[float]]:
+        """Return cached embeddings keyed by the SHA-256 of the embedded text."""
+        if not text_hashes:
+            return {}
+        
+        async with self.pool.acquire() as conn:
+            query = """
+                SELECT text_sha256, embedding FROM embedding_cache
+                WHERE text_sha256 = ANY($1::bytea[]) AND model_version = $2
+            """
+            rows = await conn.fetch(query, text_hashes, model_version)
+            return {
+                bytes(row['text_sha256']): _embedding_to_list(row['embedding'])
+                for row in rows if row['embedding'] is not None
+            }
+    
+    async def store_cached_embeddings(
+        self,
+        embeddings: List[Tuple[bytes, List[float]]],
+        model_version: str
+    ):
+        if not embeddings:
+            return
+        
+        async with self.pool.acquire() as conn:
+            query = """
+                INSERT INTO embedding_cache (text_sha256, model_version, embedding)
+                VALUES ($1, $2, $3)
+                ON CONFLICT (text_sha256, model_version) DO NOTHING
+            """
+            await conn.executemany(
+                query,
+                [(text_hash, model_version, embedding) for text_hash, embedding in embeddings]
+            )
     
     # Match operations
     async def upsert_match(
@@ -533,7 +692,7 @@ class DatabaseRepository:
                     score = EXCLUDED.score,
                     reason_json = EXCLUDED.reason_json,
                     created_at = now()
-                RETURNING *
+                RETURNING job_id, consultant_id, score::float8 AS score, reason_json, created_at
             """
             
             row = await conn.fetchrow(
@@ -541,17 +700,54 @@ class DatabaseRepository:
                 job_id,
                 consultant_id,
                 score,
-                json.dumps(reason_json)
+                orjson.dumps(reason_json).decode()
             )
             
             return JobConsultantMatch(
                 job_id=row['job_id'],
                 consultant_id=row['consultant_id'],
                 score=row['score'],
-                reason_json=json.loads(row['reason_json']),
+                reason_json=orjson.loads(row['reason_json']),
                 created_at=row['created_at']
             )
     
+    async def upsert_matches(
+        self,
+        matches: List[Tuple[UUID, UUID, float, Dict[str, Any]]]
+    ) -> List[JobConsultantMatch]:
+        """Upsert (job_id, consultant_id, score, reason_json) rows in one statement; returns them in input order."""
+        if not matches:
+            return []
+        
+        # ON CONFLICT cannot touch the same row twice in one statement; the last entry
+        # for a pair wins, as it would with one upsert per row
+        rows_in = list({(m[0], m[1]): m for m in matches}.values())
+        
+        async with self.pool.acquire() as conn:
+            query = """
+                INSERT INTO job_consultant_matches (
+                    job_id, consultant_id, score, reason_json
+                )
+                SELECT * FROM unnest($1::uuid[], $2::uuid[], $3::numeric[], $4::jsonb[])
+                ON CONFLICT (job_id, consultant_id)
+                DO UPDATE SET
+                    score = EXCLUDED.score,
+                    reason_json = EXCLUDED.reason_json,
+                    created_at = now()
+                RETURNING job_id, consultant_id, score::float8 AS score, reason_json, created_at
+            """
+            rows = await conn.fetch(
+                query,
+                [m[0] for m in rows_in],
+                [m[1] for m in rows_in],
+                [m[2] for m in rows_in],
+                [orjson.dumps(m[3]).decode() for m in rows_in]
+            )
+            
+            # RETURNING order isn't guaranteed; restore the caller's order
+            by_key = {(row['job_id'], row['consultant_id']): row for row in rows}
+            return [self._row_to_match(by_key[(m[0], m[1])]) for m in matches]
+    
     async def get_matches_for_job(
         self,
         job_id: UUID,
@@ -560,7 +756,8 @@ class DatabaseRepository:
     ) -> List[JobConsultantMatch]:
         async with self.pool.acquire() as conn:
             query = """
-                SELECT * FROM job_consultant_matches
+                SELECT job_id, consultant_id, score::float8 AS score, reason_json, created_at
+                FROM job_consultant_matches
                 WHERE job_id = $1 AND score >= $2
                 ORDER BY score DESC
                 LIMIT $3
@@ -608,15 +805,16 @@ class DatabaseRepository:
     # Ingestion log operations
     async def create_ingestion_log(
         self,
-        source: str
+        source: str,
+        feed_url: Optional[str] = None
     ) -> UUID:
         async with self.pool.acquire() as conn:
             query = """
-                INSERT INTO ingestion_log (source, status)
-                VALUES ($1, 'started')
+                INSERT INTO ingestion_log (source, status, feed_url)
+                VALUES ($1, 'started', $2)
                 RETURNING run_id
             """
-            row = await conn.fetchrow(query, source)
+            row = await conn.fetchrow(query, source, feed_url)
             return row['run_id']
     
     async def update_ingestion_log(
@@ -625,7 +823,9 @@ class DatabaseRepository:
         status: str,
         found_count: int = 0,
         upserted_count: int = 0,
-        skipped_count: int = 0
+        skipped_count: int = 0,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
     ):
         async with self.pool.acquire() as conn:
             query = """
@@ -634,6 +834,8 @@ class DatabaseRepository:
                     found_count = $3,
                     upserted_count = $4,
                     skipped_count = $5,
+                    etag = $6,
+                    last_modified = $7,
                     finished_at = now()
                 WHERE run_id = $1
             """
@@ -643,12 +845,33 @@ class DatabaseRepository:
                 status,
                 found_count,
                 upserted_count,
-                skipped_count
+                skipped_count,
+                etag,
+                last_modified
             )
     
-    # Helper methods to convert database rows to models
+    async def get_last_successful_ingestion(
+        self,
+        source: str,
+        feed_url: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the most recent completed ingestion run for a source, or for one of its feeds."""
+        async with self.pool.acquire() as conn:
+            query = """
+                SELECT run_id, source, feed_url, status, etag, last_modified, finished_at
+                FROM ingestion_log
+                WHERE source = $1 AND status = 'completed'
+                  AND ($2::text IS NULL OR feed_url = $2)
+                ORDER BY finished_at DESC
+                LIMIT 1
+            """
+            row = await conn.fetchrow(query, source, feed_url)
+            return dict(row) if row else None
+    
+    # Helper methods to convert database rows to models. asyncpg already decodes
+    # UUID, date, timestamp and array columns, so rows skip pydantic validation.
     def _row_to_job(self, row) -> Job:
-        return Job(
+        return Job.model_construct(
             job_id=row['job_id'],
             job_uid=row['job_uid'],
             source=row['source'],
@@ -660,7 +883,7 @@ class DatabaseRepository:
             languages=list(row['languages']) if row['languages'] else [],
             location_city=row['location_city'],
             location_country=row['location_country'],
-            onsite_mode=row['onsite_mode'],
+            onsite_mode=OnsiteMode(row['onsite_mode']) if row['onsite_mode'] else None,
             duration=row['duration'],
             start_date=row['start_date'],
             company_id=row['company_id'],
@@ -670,11 +893,11 @@ class DatabaseRepository:
             scraped_etag=row['scraped_etag'],
             scraped_last_modified=row['scraped_last_modified'],
             scraped_at=row['scraped_at'],
-            raw_json=json.loads(row['raw_json']) if row['raw_json'] else None
+            raw_json=orjson.loads(row['raw_json']) if row['raw_json'] else None
         )
     
     def _row_to_consultant(self, row) -> Consultant:
-        return Consultant(
+        return Consultant.model_construct(
             consultant_id=row['consultant_id'],
             name=row['name'],
             role=row['role'],
@@ -683,7 +906,7 @@ class DatabaseRepository:
             languages=list(row['languages']) if row['languages'] else [],
             location_city=row['location_city'],
             location_country=row['location_country'],
-            onsite_mode=row['onsite_mode'],
+            onsite_mode=OnsiteMode(row['onsite_mode']) if row['onsite_mode'] else None,
             availability_from=row['availability_from'],
             notes=row['notes'],
             profile_url=row['profile_url'],
@@ -692,12 +915,26 @@ class DatabaseRepository:
             updated_at=row['updated_at']
         )
     
+    def _row_to_company(self, row) -> Company:
+        return Company.model_construct(
+            company_id=row['company_id'],
+            normalized_name=row['normalized_name'],
+            aliases=list(row['aliases']) if row['aliases'] else []
+        )
+    
+    def _row_to_broker(self, row) -> Broker:
+        return Broker.model_construct(
+            broker_id=row['broker_id'],
+            name=row['name'],
+            portal_url=row['portal_url']
+        )
+    
     def _row_to_match(self, row) -> JobConsultantMatch:
-        return JobConsultantMatch(
+        return JobConsultantMatch.model_construct(
             job_id=row['job_id'],
             consultant_id=row['consultant_id'],
             score=row['score'],
-            reason_json=json.loads(row['reason_json']),
+            reason_json=orjson.loads(row['reason_json']),
             created_at=row['created_at']
         )
     
@@ -717,6 +954,74 @@ class DatabaseRepository:
             aliases=[company_name]
         ))
     
+    async def get_or_create_companies(self, company_names: List[str]) -> Dict[str, Company]:
+        """Resolve many company names at once, creating missing ones; keyed by the given name."""
+        # First spelling of each normalized name becomes the alias of a new company
+        originals: Dict[str, str] = {}
+        for name in company_names:
+            originals.setdefault(name.lower().strip(), name)
+        if not originals:
+            return {}
+        
+        normalized_names = list(originals)
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO companies (normalized_name, aliases)
+                SELECT t.normalized_name, ARRAY[t.original_name]
+                FROM unnest($1::text[], $2::text[]) AS t(normalized_name, original_name)
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM companies c
+                    WHERE c.normalized_name = t.normalized_name OR t.normalized_name = ANY(c.aliases)
+                )
+                ON CONFLICT (normalized_name) DO NOTHING
+                """,
+                normalized_names,
+                [originals[name] for name in normalized_names]
+            )
+            rows = await conn.fetch(
+                "SELECT * FROM companies WHERE normalized_name = ANY($1::text[]) OR aliases && $1::text[]",
+                normalized_names
+            )
+        
+        # Same precedence as get_company_by_name: exact normalized name, then alias
+        by_normalized = {}
+        for row in rows:
+            company = self._row_to_company(row)
+            if company.normalized_name in originals:
+                by_normalized[company.normalized_name] = company
+            for alias in company.aliases:
+                if alias in originals:
+                    by_normalized.setdefault(alias, company)
+        
+        return {
+            name: by_normalized[name.lower().strip()]
+            for name in company_names
+            if name.lower().strip() in by_normalized
+        }
+    
+    async def get_or_create_brokers(self, broker_names: List[str]) -> Dict[str, Broker]:
+        """Resolve many broker names at once, creating missing ones; keyed by name."""
+        names = list(dict.fromkeys(broker_names))
+        if not names:
+            return {}
+        
+        async with self.pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO brokers (name)
+                SELECT unnest($1::text[])
+                ON CONFLICT (name) DO NOTHING
+                """,
+                names
+            )
+            rows = await conn.fetch("SELECT * FROM brokers WHERE name = ANY($1::text[])", names)
+        
+        return {
+            row['name']: self._row_to_broker(row)
+            for row in rows
+        }
+    
     async def get_or_create_broker(self, broker_name: str) -> Broker:
         """Get existing broker or create new one."""
         # Check if broker exists
@@ -1405,9 +1710,62 @@ class DatabaseRepository:
             return await conn.fetchval(query, param_name, param_value, effectiveness_score, config_id)
 
     async def upsert_jobs(self, jobs: List[JobIn]) -> List[Job]:
-        """Bulk upsert multiple jobs"""
-        result_jobs = []
-        for job_in in jobs:
-            job = await self.upsert_job(job_in)
-            result_jobs.append(job)
-        return result_jobs
+        """Bulk upsert multiple jobs in a single statement, returned in input order"""
+        if not jobs:
+            return []
+        
+        # ON CONFLICT may only touch a row once per statement, so the last copy of a job wins
+        unique_jobs = {job.job_uid: job for job in jobs}
+        # orjson serializes UUID, date/datetime and the str enums itself, so the
+        # python-mode dump is enough and skips pydantic's JSON conversion pass
+        payload = orjson.dumps([
+            job.model_dump(include=_JOB_UPSERT_FIELDS) for job in unique_jobs.values()
+        ], option=orjson.OPT_NON_STR_KEYS).decode()
+        
+        async with self.pool.acquire() as conn:
+            query = """
+                INSERT INTO jobs (
+                    job_uid, source, title, description, skills, role, seniority,
+                    languages, location_city, location_country, onsite_mode,
+                    duration, start_date, company_id, broker_id, url,
+                    posted_at, scraped_etag, scraped_last_modified, raw_json
+                )
+                SELECT
+                    job_uid, source, title, description, COALESCE(skills, '{}'), role, seniority,
+                    COALESCE(languages, '{}'), location_city, location_country, onsite_mode,
+                    duration, start_date, company_id, broker_id, url,
+                    posted_at, scraped_etag, scraped_last_modified, raw_json
+                FROM jsonb_to_recordset($1::jsonb) AS j(
+                    job_uid TEXT, source TEXT, title TEXT, description TEXT, skills TEXT[],
+                    role TEXT, seniority TEXT, languages TEXT[], location_city TEXT,
+                    location_country TEXT, onsite_mode TEXT, duration TEXT, start_date DATE,
+                    company_id UUID, broker_id UUID, url TEXT, posted_at TIMESTAMPTZ,
+                    scraped_etag TEXT, scraped_last_modified TEXT, raw_json JSONB
+                )
+                ON CONFLICT (job_uid)
+                DO UPDATE SET
+                    title = EXCLUDED.title,
+                    description = EXCLUDED.description,
+                    skills = EXCLUDED.skills,
+                    role = EXCLUDED.role,
+                    seniority = EXCLUDED.seniority,
+                    languages = EXCLUDED.languages,
+                    location_city = EXCLUDED.location_city,
+                    location_country = EXCLUDED.location_country,
+                    onsite_mode = EXCLUDED.onsite_mode,
+                    duration = EXCLUDED.duration,
+                    start_date = EXCLUDED.start_date,
+                    company_id = EXCLUDED.company_id,
+                    broker_id = EXCLUDED.broker_id,
+                    url = EXCLUDED.url,
+                    posted_at = EXCLUDED.posted_at,
+                    scraped_etag = EXCLUDED.scraped_etag,
+                    scraped_last_modified = EXCLUDED.scraped_last_modified,
+                    raw_json = EXCLUDED.raw_json,
+                    scraped_at = now()
+                RETURNING *
+            """
+            rows = await conn.fetch(query, payload)
+        
+        saved = {row['job_uid']: self._row_to_job(row) for row in rows}
+        return [saved[job_uid] for job_uid in unique_jobs if job_uid in saved]
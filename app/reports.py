@@ -1,5 +1,7 @@
+import os
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from collections import Counter
 import logging
 
@@ -8,24 +10,39 @@ from app.models import ReportSummary
 
 logger = logging.getLogger(__name__)
 
+# How long a generated report is reused; reports cover whole days, so minute-level freshness isn't needed
+REPORT_CACHE_TTL_SECONDS = float(os.getenv("REPORT_CACHE_TTL_SECONDS", "3600"))
+
 
 class ReportingService:
     def __init__(self, db_repo: DatabaseRepository):
         self.db = db_repo
+        self._report_cache: Dict[int, Tuple[float, ReportSummary]] = {}
     
     async def generate_daily_report(self) -> ReportSummary:
         """Generate daily report for the last 24 hours."""
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(days=1)
-        
-        return await self._generate_report(start_time, end_time)
+        return await self._cached_report(days=1)
     
     async def generate_weekly_report(self) -> ReportSummary:
         """Generate weekly report for the last 7 days."""
-        end_time = datetime.now(timezone.utc)
-        start_time = end_time - timedelta(days=7)
+        return await self._cached_report(days=7)
+    
+    def clear_report_cache(self) -> None:
+        """Drop cached reports so the next request regenerates them."""
+        self._report_cache.clear()
+    
+    async def _cached_report(self, days: int) -> ReportSummary:
+        """Return the report for the last `days` days, reusing it for REPORT_CACHE_TTL_SECONDS."""
+        now = time.monotonic()
+        cached = self._report_cache.get(days)
+        if cached and now - cached[0] <= REPORT_CACHE_TTL_SECONDS:
+            return cached[1]
         
-        return await self._generate_report(start_time, end_time)
+        end_time = datetime.now(timezone.utc)
+        start_time = end_time - timedelta(days=days)
+        report = await self._generate_report(start_time, end_time)
+        self._report_cache[days] = (now, report)
+        return report
     
     async def _generate_report(
         self,
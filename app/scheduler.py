@@ -4,6 +4,7 @@ Manages daily scanning tasks for the AI consultant assignment scanner.
 """
 
 import os
+import time
 import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
@@ -32,6 +33,9 @@ from app.reports import ReportingService
 
 logger = logging.getLogger(__name__)
 
+# How long scheduler.get_jobs() results are reused; the scanner page polls via HTMX
+JOBS_CACHE_TTL_SECONDS = 2.0
+
 
 class ScannerScheduler:
     """
@@ -59,6 +63,8 @@ class ScannerScheduler:
         # Initialize scheduler
         self.scheduler = AsyncIOScheduler(timezone="Europe/Stockholm")
         self.is_running = False
+        self._jobs_cache: Optional[List[Any]] = None
+        self._jobs_cache_at = 0.0
         
         # Configuration
         self.enabled_sources = {
@@ -117,6 +123,7 @@ class ScannerScheduler:
             
             self.scheduler.start()
             self.is_running = True
+            self.clear_jobs_cache()
             logger.info("Scanner scheduler started successfully")
             
         except Exception as e:
@@ -131,6 +138,7 @@ class ScannerScheduler:
         try:
             self.scheduler.shutdown(wait=True)
             self.is_running = False
+            self.clear_jobs_cache()
             logger.info("Scanner scheduler stopped successfully")
         except Exception as e:
             logger.error(f"Error stopping scheduler: {e}")
@@ -185,6 +193,9 @@ class ScannerScheduler:
             logger.info(f"Daily scan completed: {total_jobs_found} jobs found, "
                        f"{total_matches_generated} matches generated in {scan_duration}")
             
+            # Reports cached before the scan don't include its jobs and matches
+            self.reporting_service.clear_report_cache()
+            
         except Exception as e:
             logger.error(f"Daily scan failed: {e}")
             raise
@@ -439,6 +450,7 @@ class ScannerScheduler:
     async def trigger_scan_now(self, config_id: Optional[UUID] = None):
         """Manually trigger a scan for testing purposes."""
         logger.info("Manual scan triggered")
+        self.clear_jobs_cache()
         
         if config_id:
             config = await self.db_repo.get_scanning_config(config_id)
@@ -447,13 +459,28 @@ class ScannerScheduler:
         else:
             await self.run_daily_scan()
     
+    def get_jobs(self) -> List[Any]:
+        """
+        Return scheduled jobs, reusing the last lookup for JOBS_CACHE_TTL_SECONDS.
+        Call clear_jobs_cache() after changing the job list to force a refresh.
+        """
+        now = time.monotonic()
+        if self._jobs_cache is None or now - self._jobs_cache_at > JOBS_CACHE_TTL_SECONDS:
+            self._jobs_cache = self.scheduler.get_jobs()
+            self._jobs_cache_at = now
+        return self._jobs_cache
+
+    def clear_jobs_cache(self) -> None:
+        """Drop the cached job list so the next get_jobs() call re-reads the scheduler."""
+        self._jobs_cache = None
+
     def get_scheduler_status(self) -> Dict[str, Any]:
         """Get current scheduler status and next run times."""
         if not self.is_running:
             return {"status": "stopped"}
         
         jobs_status = []
-        for job in self.scheduler.get_jobs():
+        for job in self.get_jobs():
             jobs_status.append({
                 "id": job.id,
                 "name": job.name,
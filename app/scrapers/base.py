@@ -3,7 +3,7 @@ Base scraper class for all assignment portal scrapers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime, timezone
 import asyncio
 import logging
@@ -20,9 +20,11 @@ logger = logging.getLogger(__name__)
 class BaseScraper(ABC):
     """Abstract base class for job assignment scrapers."""
     
-    def __init__(self, source_name: str, base_url: str):
+    def __init__(self, source_name: str, base_url: str, client: Optional[httpx.AsyncClient] = None):
         self.source_name = source_name
         self.base_url = base_url
+        # Shared client from the app; when None each context opens (and closes) its own
+        self.client = client
         self.session: Optional[httpx.AsyncClient] = None
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -38,8 +40,7 @@ class BaseScraper(ABC):
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = httpx.AsyncClient(
-            headers=self.headers,
+        self.session = self.client or httpx.AsyncClient(
             timeout=30.0,
             follow_redirects=True
         )
@@ -47,7 +48,7 @@ class BaseScraper(ABC):
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
+        if self.session and self.session is not self.client:
             await self.session.aclose()
     
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
@@ -63,7 +64,9 @@ class BaseScraper(ABC):
             raise RuntimeError("Scraper must be used as async context manager")
         
         logger.debug(f"Fetching {url}")
-        response = await self.session.get(url, **kwargs)
+        # Headers go on each request so a shared client carries no per-scraper state
+        headers = {**self.headers, **kwargs.pop('headers', {})}
+        response = await self.session.get(url, headers=headers, follow_redirects=True, **kwargs)
         response.raise_for_status()
         
         self.last_request_time = asyncio.get_event_loop().time()
@@ -79,16 +82,22 @@ class BaseScraper(ABC):
         """Parse a single job listing. Must be implemented by subclasses."""
         pass
     
+    async def iter_listings(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield raw listings as they are scraped. Subclasses override this to stream page by page."""
+        for listing_data in await self.scrape_listings():
+            yield listing_data
+    
+    async def iter_jobs(self) -> AsyncIterator[JobIn]:
+        """Yield JobIn models as listings are scraped."""
+        async for listing_data in self.iter_listings():
+            job = self.create_job_model(listing_data)
+            if job:
+                yield job
+    
     async def scrape(self) -> List[JobIn]:
         """Main scraping method that returns JobIn models."""
         try:
-            raw_listings = await self.scrape_listings()
-            jobs = []
-            
-            for listing_data in raw_listings:
-                job = self.create_job_model(listing_data)
-                if job:
-                    jobs.append(job)
+            jobs = [job async for job in self.iter_jobs()]
             
             logger.info(f"Scraped {len(jobs)} jobs from {self.source_name}")
             return jobs
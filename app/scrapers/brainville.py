@@ -2,9 +2,10 @@
 Brainville job portal scraper.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime, timezone
 import logging
+import httpx
 import re
 from selectolax.parser import HTMLParser
 import json
@@ -18,17 +19,22 @@ logger = logging.getLogger(__name__)
 class BrainvilleScraper(BaseScraper):
     """Scraper for Brainville consulting assignments."""
     
-    def __init__(self):
+    def __init__(self, client: Optional[httpx.AsyncClient] = None):
         super().__init__(
             source_name="brainville",
-            base_url="https://www.brainville.com"
+            base_url="https://www.brainville.com",
+            client=client
         )
         self.listings_url = f"{self.base_url}/konsultuppdrag"
         self.max_pages = 10  # Limit pages to scrape
     
     async def scrape_listings(self) -> List[Dict[str, Any]]:
         """Scrape job listings from Brainville."""
-        all_listings = []
+        return [listing_data async for listing_data in self.iter_listings()]
+    
+    async def iter_listings(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield Brainville job listings page by page."""
+        listing_count = 0
         
         try:
             # Start with the main listings page
@@ -60,7 +66,8 @@ class BrainvilleScraper(BaseScraper):
                             if detailed_data:
                                 listing_data.update(detailed_data)
                         
-                        all_listings.append(listing_data)
+                        listing_count += 1
+                        yield listing_data
                 
                 # Check if there's a next page
                 next_button = html.css_first('.pagination .next, a[rel="next"], .next-page')
@@ -73,12 +80,10 @@ class BrainvilleScraper(BaseScraper):
                 import asyncio
                 await asyncio.sleep(self.rate_limit_delay)
             
-            logger.info(f"Scraped {len(all_listings)} listings from Brainville")
+            logger.info(f"Scraped {listing_count} listings from Brainville")
             
         except Exception as e:
             logger.error(f"Error scraping Brainville listings: {e}")
-        
-        return all_listings
     
     def parse_listing(self, listing_element) -> Optional[Dict[str, Any]]:
         """Parse a single job listing element."""
@@ -3,9 +3,10 @@ Verama job portal scraper.
 Focuses on senior and expert-level consultant assignments.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime, timezone, timedelta
 import logging
+import httpx
 import re
 import json
 import asyncio
@@ -16,6 +17,16 @@ from app.scrapers.base import BaseScraper
 logger = logging.getLogger(__name__)
 
 
+# Other spellings of a country that Verama uses in location fields
+_COUNTRY_VARIATIONS = {
+    "SE": ["sweden", "sverige", "se"],
+    "NO": ["norway", "norge", "no"],
+    "DK": ["denmark", "danmark", "dk"],
+    "FI": ["finland", "suomi", "fi"],
+    "PL": ["poland", "polen", "polska", "pl"],
+}
+
+
 class VeramaScraper(BaseScraper):
     """
     Scraper for Verama consulting assignments.
@@ -30,7 +41,8 @@ class VeramaScraper(BaseScraper):
         target_roles: Optional[List[str]] = None,
         target_keywords: Optional[List[str]] = None,
         onsite_modes: Optional[List[str]] = None,
-        target_locations: Optional[List[str]] = None
+        target_locations: Optional[List[str]] = None,
+        client: Optional[httpx.AsyncClient] = None
     ):
         """
         Initialize Verama scraper with configurable filters.
@@ -43,7 +55,8 @@ class VeramaScraper(BaseScraper):
         """
         super().__init__(
             source_name="verama",
-            base_url="https://app.verama.com"
+            base_url="https://app.verama.com",
+            client=client
         )
         self.api_base = f"{self.base_url}/api/public"
         self.job_listings_url = f"{self.api_base}/job-requests"
@@ -73,6 +86,14 @@ class VeramaScraper(BaseScraper):
             "GB": "Storbritannien"
         }
         
+        # Lowercase substrings that identify each target country in a job's location,
+        # built once instead of per job in should_include_job
+        self.country_terms = []
+        for country_code in self.countries:
+            terms = [country_code.lower(), self.country_mapping.get(country_code, country_code).lower()]
+            terms.extend(_COUNTRY_VARIATIONS.get(country_code, []))
+            self.country_terms.extend(terms)
+        
         # Filters for senior/expert positions
         self.default_params = {
             "languages": self.languages,
@@ -83,7 +104,11 @@ class VeramaScraper(BaseScraper):
     
     async def scrape_listings(self) -> List[Dict[str, Any]]:
         """Scrape job listings from Verama."""
-        all_listings = []
+        return [listing_data async for listing_data in self.iter_listings()]
+    
+    async def iter_listings(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yield Verama job listings page by page."""
+        listing_count = 0
         
         try:
             page = 1
@@ -132,7 +157,8 @@ class VeramaScraper(BaseScraper):
                         if not self.matches_target_profile(parsed_job):
                             continue
 
-                        all_listings.append(parsed_job)
+                        listing_count += 1
+                        yield parsed_job
                 
                 # Check if there are more pages
                 if data.get("last", True):
@@ -143,12 +169,10 @@ class VeramaScraper(BaseScraper):
                 # Rate limiting
                 await asyncio.sleep(self.rate_limit_delay)
             
-            logger.info(f"Scraped {len(all_listings)} listings from Verama")
+            logger.info(f"Scraped {listing_count} listings from Verama")
             
         except Exception as e:
             logger.error(f"Error scraping Verama listings: {e}")
-        
-        return all_listings
     
     def parse_job(self, job_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Parse a single job from the API response."""
@@ -296,28 +320,7 @@ class VeramaScraper(BaseScraper):
         # Country filter
         if self.countries:
             job_country = (job.get('location_country') or "").lower()
-            country_match = False
-
-            for country_code in self.countries:
-                country_name = self.country_mapping.get(country_code, country_code)
-                if country_code.lower() in job_country or country_name.lower() in job_country:
-                    country_match = True
-                    break
-
-                country_variations = {
-                    "SE": ["sweden", "sverige", "se"],
-                    "NO": ["norway", "norge", "no"],
-                    "DK": ["denmark", "danmark", "dk"],
-                    "FI": ["finland", "suomi", "fi"],
-                    "PL": ["poland", "polen", "polska", "pl"],
-                }
-
-                if country_code in country_variations:
-                    if any(variation in job_country for variation in country_variations[country_code]):
-                        country_match = True
-                        break
-
-            if not country_match:
+            if not any(term in job_country for term in self.country_terms):
                 return False
 
         # Onsite mode filter
@@ -54,10 +54,19 @@ CREATE TABLE IF NOT EXISTS jobs (
 
 CREATE TABLE IF NOT EXISTS job_embeddings (
   job_id UUID PRIMARY KEY REFERENCES jobs(job_id) ON DELETE CASCADE,
-  embedding vector(1536),
+  embedding halfvec(1536),
   updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
 );
 
+-- Embeddings keyed by the SHA-256 of the embedded text, so unchanged listings are not re-embedded
+CREATE TABLE IF NOT EXISTS embedding_cache (
+  text_sha256 BYTEA NOT NULL,
+  model_version TEXT NOT NULL,
+  embedding halfvec(1536),
+  created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  PRIMARY KEY (text_sha256, model_version)
+);
+
 CREATE TABLE IF NOT EXISTS consultants (
   consultant_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
   name TEXT NOT NULL,
@@ -78,7 +87,7 @@ CREATE TABLE IF NOT EXISTS consultants (
 
 CREATE TABLE IF NOT EXISTS consultant_embeddings (
   consultant_id UUID PRIMARY KEY REFERENCES consultants(consultant_id) ON DELETE CASCADE,
-  embedding vector(1536),
+  embedding halfvec(1536),
   updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
 );
 
@@ -99,9 +108,18 @@ CREATE TABLE IF NOT EXISTS ingestion_log (
   upserted_count INT DEFAULT 0,
   skipped_count INT DEFAULT 0,
   started_at TIMESTAMPTZ NOT NULL DEFAULT now(),
-  finished_at TIMESTAMPTZ
+  finished_at TIMESTAMPTZ,
+  -- Feed validators for conditional refetches, keyed by the feed they came from
+  feed_url TEXT,
+  etag TEXT,
+  last_modified TEXT
 );
 
+-- Databases created before the feed validator columns existed
+ALTER TABLE ingestion_log ADD COLUMN IF NOT EXISTS feed_url TEXT;
+ALTER TABLE ingestion_log ADD COLUMN IF NOT EXISTS etag TEXT;
+ALTER TABLE ingestion_log ADD COLUMN IF NOT EXISTS last_modified TEXT;
+
 -- Unified AI Scanner Configuration System
 CREATE TABLE IF NOT EXISTS scanning_configs (
   config_id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -175,8 +193,9 @@ CREATE INDEX IF NOT EXISTS idx_jobs_company  ON jobs(company_id);
 CREATE INDEX IF NOT EXISTS idx_jobs_broker   ON jobs(broker_id);
 CREATE INDEX IF NOT EXISTS idx_jobs_gin_skills        ON jobs USING GIN (skills);
 CREATE INDEX IF NOT EXISTS idx_consultants_gin_skills ON consultants USING GIN (skills);
-CREATE INDEX IF NOT EXISTS idx_jobemb_vec       ON job_embeddings USING hnsw (embedding vector_cosine_ops);
-CREATE INDEX IF NOT EXISTS idx_consultantemb_vec ON consultant_embeddings USING hnsw (embedding vector_cosine_ops);
+-- Embeddings are stored as halfvec (fp16): half the size of vector with negligible ranking loss
+CREATE INDEX IF NOT EXISTS idx_jobemb_vec       ON job_embeddings USING hnsw (embedding halfvec_cosine_ops);
+CREATE INDEX IF NOT EXISTS idx_consultantemb_vec ON consultant_embeddings USING hnsw (embedding halfvec_cosine_ops);
 
 -- Indexes for scanning configuration system
 CREATE INDEX IF NOT EXISTS idx_scanning_configs_active ON scanning_configs(is_active);